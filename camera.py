@@ -1,3 +1,4 @@
+import numpy as np
 import pygame
 from typing import Tuple
 
@@ -118,6 +119,21 @@ class Camera:
         screen_y = (world_y - self.world_y) * self.zoom_level
         return int(screen_x), int(screen_y)
 
+    def apply_coords_batch(self, world_xy: np.ndarray) -> np.ndarray:
+        """Adjust an array of world coordinates to screen coordinates, considering zoom.
+
+        Vectorized counterpart of apply_coords for callers that keep their
+        positions in NumPy arrays.
+
+        Args:
+            world_xy (np.ndarray): Array of shape (N, 2) with world x/y pairs.
+
+        Returns:
+            np.ndarray: int32 array of shape (N, 2) with screen x/y pairs.
+        """
+        offset = np.array([self.world_x, self.world_y], dtype=np.float32)
+        return ((world_xy - offset) * np.float32(self.zoom_level)).astype(np.int32)
+
     def apply_radius(self, radius: float) -> int:
         """Adjust a world radius to a screen radius based on zoom."""
         return max(1, int(radius * self.zoom_level))
@@ -160,6 +176,15 @@ class Camera:
         # Apply bounds after zoom adjustment
         self._apply_bounds()
 
+    @property
+    def viewport_rect_world(self) -> Tuple[float, float, float, float]:
+        """The visible world area as (left, top, right, bottom), considering zoom."""
+        if self.zoom_level == 0: # Avoid division by zero
+            return self.world_x, self.world_y, self.world_x, self.world_y
+        return (self.world_x, self.world_y,
+                self.world_x + self.width / self.zoom_level,
+                self.world_y + self.height / self.zoom_level)
+
     def get_world_view(self) -> pygame.Rect:
         """Return the rectangle representing the camera's view in world coordinates."""
         if self.zoom_level == 0: # Avoid division by zero
@@ -0,0 +1,95 @@
+"""Batched unit-unit collision detection.
+
+A uniform grid narrows the candidates down to units in neighbouring cells,
+the overlap tests for those candidates are done on NumPy arrays in one pass,
+and the per-pair Python work is limited to the few pairs that actually
+overlap and need to be pushed apart.
+"""
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from game_logic import resolve_collision_with_mass, unit_positions
+from spatial_grid import SpatialGrid
+
+if TYPE_CHECKING:
+    from units import Unit
+
+
+def collision_pairs(xs: np.ndarray, ys: np.ndarray, radii: np.ndarray,
+                    enabled: np.ndarray,
+                    candidates: Optional[Tuple[np.ndarray, np.ndarray]] = None
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """Find every pair of overlapping circles.
+
+    Squared center distances are compared against the squared sum of radii,
+    so no square roots are taken.
+
+    Args:
+        xs (np.ndarray): Circle center x-coordinates.
+        ys (np.ndarray): Circle center y-coordinates.
+        radii (np.ndarray): Circle radii.
+        enabled (np.ndarray): Boolean mask; circles with False never collide.
+        candidates (Optional[Tuple[np.ndarray, np.ndarray]]): Index arrays
+            (i, j) with i < j from a broad phase. If None, every pair is tested.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Index arrays (i, j) with i < j, ordered
+        by i and then j like a nested loop over the pairs would be.
+    """
+    if candidates is None:
+        dx = xs[None, :] - xs[:, None]
+        dy = ys[None, :] - ys[:, None]
+        reach = radii[None, :] + radii[:, None]
+        overlapping = dx * dx + dy * dy <= reach * reach
+        overlapping &= enabled[None, :] & enabled[:, None]
+        # Keep only the upper triangle so each pair (and no unit with itself) appears once
+        return np.nonzero(np.triu(overlapping, k=1))
+
+    first, second = candidates
+    dx = xs[second] - xs[first]
+    dy = ys[second] - ys[first]
+    reach = radii[first] + radii[second]
+    overlapping = dx * dx + dy * dy <= reach * reach
+    overlapping &= enabled[first] & enabled[second]
+    first = first[overlapping]
+    second = second[overlapping]
+    # The broad phase yields pairs cell by cell; restore nested-loop order
+    order = np.lexsort((second, first))
+    return first[order], second[order]
+
+
+def resolve_unit_collisions(units: List['Unit']) -> None:
+    """Push apart every pair of overlapping units.
+
+    Candidate pairs come from a SpatialGrid broad phase, their overlaps are
+    tested at once from the positions at the start of the call, and they are
+    then resolved one pair at a time with resolve_collision_with_mass so
+    masses and carriers are honoured.
+
+    Args:
+        units (List[Unit]): Units to separate. Units whose collision_enabled
+            is False (e.g. fighters landing on a carrier) are skipped.
+    """
+    count = len(units)
+    if count < 2:
+        return
+
+    xs, ys = unit_positions(units)
+    radii = np.fromiter((unit.radius for unit in units), dtype=np.float64, count=count)
+    enabled = np.fromiter((getattr(unit, 'collision_enabled', True) for unit in units),
+                          dtype=bool, count=count)
+
+    # Two units can only overlap if they are within twice the largest radius
+    grid = SpatialGrid(cell_size=2 * float(radii.max()) or 1.0)
+    grid.rebuild(units)
+    candidates = np.fromiter(
+        (index for pair in grid.query_pairs() for index in pair), dtype=np.intp
+    ).reshape(-1, 2)
+    if not len(candidates):
+        return
+
+    first, second = collision_pairs(xs, ys, radii, enabled,
+                                    candidates=(candidates[:, 0], candidates[:, 1]))
+    for i, j in zip(first.tolist(), second.tolist()):
+        resolve_collision_with_mass(units[i], units[j])
@@ -21,3 +21,9 @@ MINIMAP_UNIT_SIZE: int = 2 # Size of dots on minimap
 # --- Scaling Factors ---
 MINIMAP_SCALE_X: float = MINIMAP_WIDTH / MAP_WIDTH
 MINIMAP_SCALE_Y: float = MINIMAP_HEIGHT / MAP_HEIGHT
+
+# Minimap layout bundled for render loops that unpack it into locals once:
+# (scale_x, scale_y, x, y, width, height)
+MINIMAP_PARAMS: tuple[float, float, int, int, int, int] = (
+    MINIMAP_SCALE_X, MINIMAP_SCALE_Y, MINIMAP_X, MINIMAP_Y, MINIMAP_WIDTH, MINIMAP_HEIGHT
+)
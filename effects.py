@@ -1,6 +1,10 @@
-from typing import Tuple
+import functools
+import math
+from typing import Optional, Tuple
 
+import numpy as np
 import pygame
+import pygame.gfxdraw
 
 from camera import Camera
 
@@ -23,10 +27,14 @@ class AttackEffect:
         """
         self.start_pos = start_pos
         self.end_pos = end_pos
+        # Integer positions for camera conversion, fixed for the effect's lifetime
+        self._start_i = (int(start_pos[0]), int(start_pos[1]))
+        self._end_i = (int(end_pos[0]), int(end_pos[1]))
         self.color = color
         self.duration = duration
         self.timer = duration # Countdown timer
         self.thickness = thickness
+        self._inv_duration = 1.0 / duration if duration > 0 else 0.0 # 0 keeps the beam invisible
 
     def update(self, dt: float) -> None:
         """Update the effect's timer."""
@@ -36,53 +44,133 @@ class AttackEffect:
         """Check if the effect's timer has run out."""
         return self.timer <= 0
 
+    # The single removal check update_effects calls, looked up on the class
+    _is_dead = is_expired
+
     def draw(self, surface: pygame.Surface, camera: Camera) -> None:
         """Draw the attack effect (layered beam)."""
+        # Skip beams whose bounding box (plus glow) lies entirely off-screen
+        left, top, right, bottom = camera.viewport_rect_world
+        margin = _beam_margin(self.thickness) / camera.zoom_level
+        (start_x, start_y), (end_x, end_y) = self.start_pos, self.end_pos
+        if (max(start_x, end_x) + margin < left or min(start_x, end_x) - margin > right or
+                max(start_y, end_y) + margin < top or min(start_y, end_y) - margin > bottom):
+            return
+
         # Convert world coordinates to screen coordinates
-        screen_start = camera.apply_coords(int(self.start_pos[0]), int(self.start_pos[1]))
-        screen_end = camera.apply_coords(int(self.end_pos[0]), int(self.end_pos[1]))
+        screen_start = camera.apply_coords(*self._start_i)
+        screen_end = camera.apply_coords(*self._end_i)
 
-        # Calculate alpha based on remaining time (fade out quickly)
-        if self.duration <= 0: # Avoid division by zero
-            alpha = 0
-        else:
-            # Square the ratio to make it fade faster towards the end
-            time_left_ratio = max(0.0, self.timer / self.duration)
-            alpha = max(0, min(255, int((time_left_ratio ** 2) * 255)))
+        # Calculate alpha based on remaining time, squared to fade faster towards
+        # the end. The timer never exceeds the duration, so only clamp below.
+        time_left_ratio = self.timer * self._inv_duration
+        if time_left_ratio < 0.0:
+            time_left_ratio = 0.0
+        alpha = int(time_left_ratio * time_left_ratio * 255)
 
         if alpha <= 0:
             return # Don't draw if fully faded
 
-        # Define thicknesses
-        outer_thickness = int(self.thickness * 2.5) # Make outer glow noticeably thicker
-        inner_thickness = self.thickness
-        max_thickness = outer_thickness # For bounding box calculation
+        _draw_beam(surface, screen_start, screen_end, self.color, alpha, self.thickness)
+
+
+# Beam sprites are cached per bucketed length and alpha so every beam of a
+# similar size reuses one pre-rendered horizontal sprite
+_BEAM_LENGTH_STEP = 16 # Beam lengths are rounded to this many pixels
+_BEAM_ALPHA_SHIFT = 5 # 256 >> 5 = 8 alpha steps
+
+
+@functools.lru_cache(maxsize=256)
+def _beam_surface(length_bucket: int, alpha_bucket: int, thickness: int,
+                  color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render a horizontal layered beam once for a (length, alpha, thickness, color) bucket.
+
+    Args:
+        length_bucket (int): Beam length in pixels, a multiple of _BEAM_LENGTH_STEP.
+        alpha_bucket (int): Opacity step (0-7); step 7 is fully opaque.
+        thickness (int): Thickness of the inner core.
+        color (Tuple[int, int, int]): Color of the outer glow.
 
-        # Create a temporary surface for alpha blending
-        # Determine bounds needed for the thickest line
-        min_x = min(screen_start[0], screen_end[0]) - max_thickness
-        max_x = max(screen_start[0], screen_end[0]) + max_thickness
-        min_y = min(screen_start[1], screen_end[1]) - max_thickness
-        max_y = max(screen_start[1], screen_end[1]) + max_thickness
-        width = max(1, int(max_x - min_x))
-        height = max(1, int(max_y - min_y))
+    Returns:
+        pygame.Surface: The beam with premultiplied alpha, centered vertically on the surface.
+    """
+    alpha = (alpha_bucket << _BEAM_ALPHA_SHIFT) + (1 << _BEAM_ALPHA_SHIFT) - 1
 
-        beam_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    # Define thicknesses
+    outer_thickness = int(thickness * 2.5) # Make outer glow noticeably thicker
+    inner_thickness = thickness
 
-        # Calculate line points relative to the surface
-        surf_start = (screen_start[0] - min_x, screen_start[1] - min_y)
-        surf_end = (screen_end[0] - min_x, screen_end[1] - min_y)
+    # In the faintest step the glow is practically invisible, so the sprite
+    # only holds the core; that also keeps it small to rotate and blit
+    draw_glow = alpha_bucket > 0
+    sprite_thickness = outer_thickness if draw_glow else inner_thickness
 
+    beam_surf = pygame.Surface((length_bucket, sprite_thickness * 2 + 2), pygame.SRCALPHA)
+    center_y = sprite_thickness + 1
+    surf_start = (0, center_y)
+    surf_end = (length_bucket - 1, center_y)
+
+    # Colors are premultiplied by their alpha so the additive blit in
+    # _draw_beam still fades with alpha. Lines overwrite pixels rather than
+    # blending, so scaling each color up front premultiplies the whole sprite.
+    if draw_glow:
         # Draw Outer Glow (thicker, base color)
-        outer_color = (*self.color[:3], int(alpha * 0.8)) # Slightly less alpha for glow
+        outer_alpha = int(alpha * 0.8) # Slightly less alpha for glow
+        outer_color = (*(c * outer_alpha // 255 for c in color), outer_alpha)
         pygame.draw.line(beam_surf, outer_color, surf_start, surf_end, outer_thickness)
-        
-        # Draw Inner Core (thinner, bright color)
-        inner_color = (*WHITE[:3], alpha) # Bright white core
-        pygame.draw.line(beam_surf, inner_color, surf_start, surf_end, inner_thickness)
+    
+    # Draw Inner Core (thinner, bright color)
+    inner_color = (*(c * alpha // 255 for c in WHITE[:3]), alpha) # Bright white core
+    pygame.draw.line(beam_surf, inner_color, surf_start, surf_end, inner_thickness)
+
+    # Match the display's pixel format so blits take the fast path
+    if pygame.display.get_surface() is not None:
+        beam_surf = beam_surf.convert_alpha()
+    return beam_surf
+
+
+def _beam_margin(thickness: int) -> float:
+    """How far (in screen pixels) a drawn beam can extend past its endpoints.
+
+    Covers the outer glow plus the length rounding of the cached beam sprites.
+
+    Args:
+        thickness (int): Thickness of the beam core.
+
+    Returns:
+        float: The margin in screen pixels.
+    """
+    return thickness * 2.5 + _BEAM_LENGTH_STEP // 2
+
+
+def _draw_beam(surface: pygame.Surface, screen_start: Tuple[int, int], screen_end: Tuple[int, int],
+               color: Tuple[int, int, int], alpha: int, thickness: int) -> None:
+    """Draw a layered, alpha-faded beam between two screen points.
 
-        # Blit the temporary surface onto the main screen
-        surface.blit(beam_surf, (min_x, min_y))
+    Args:
+        surface (pygame.Surface): The surface to draw on.
+        screen_start (Tuple[int, int]): Screen coordinates of the beam start.
+        screen_end (Tuple[int, int]): Screen coordinates of the beam end.
+        color (Tuple[int, int, int]): Color of the outer glow.
+        alpha (int): Opacity of the beam (1-255).
+        thickness (int): Thickness of the inner core.
+    """
+    dx = screen_end[0] - screen_start[0]
+    dy = screen_end[1] - screen_start[1]
+    length = math.hypot(dx, dy)
+    length_bucket = max(_BEAM_LENGTH_STEP,
+                        int(length + _BEAM_LENGTH_STEP // 2) // _BEAM_LENGTH_STEP * _BEAM_LENGTH_STEP)
+
+    beam_surf = _beam_surface(length_bucket, alpha >> _BEAM_ALPHA_SHIFT, thickness, tuple(color[:3]))
+    if dy:  # Horizontal beams need no rotation, the sprite is symmetric
+        # pygame rotates counter-clockwise while screen y grows downwards
+        beam_surf = pygame.transform.rotate(beam_surf, -math.degrees(math.atan2(dy, dx)))
+
+    # Blit the beam centered on the midpoint of the two endpoints. Beams add
+    # light to whatever is behind them, which suits lasers and needs no
+    # per-pixel alpha blend.
+    center = ((screen_start[0] + screen_end[0]) // 2, (screen_start[1] + screen_end[1]) // 2)
+    surface.blit(beam_surf, beam_surf.get_rect(center=center), special_flags=pygame.BLEND_RGBA_ADD)
 
 
 # --- Destination Indicator --- 
@@ -102,11 +190,19 @@ class DestinationIndicator:
         """
         self.world_x = world_x
         self.world_y = world_y
+        self._ix = int(world_x) # Integer position for camera conversion, fixed for the effect's lifetime
+        self._iy = int(world_y)
         self.initial_color = color
         self.duration = duration
         self.radius = radius
 
         self.timer = self.duration
+        self._inv_duration = 1.0 / duration if duration > 0 else 0.0
+
+        # The indicator never moves, so its screen position (None when
+        # off-screen) only changes with the camera it was computed for
+        self._last_cam: Optional[Tuple[float, float, float]] = None
+        self._screen: Optional[Tuple[int, int]] = None
 
     def update(self, dt: float) -> None:
         """Update the indicator's timer."""
@@ -116,27 +212,109 @@ class DestinationIndicator:
         """Check if the indicator's timer has expired."""
         return self.timer > 0
 
+    def _is_dead(self) -> bool:
+        """Check if the indicator should be removed (the inverse of is_alive)."""
+        return self.timer <= 0
+
     def draw(self, surface: pygame.Surface, camera: Camera) -> None:
         """Draw the fading indicator circle onto the surface."""
         if not self.is_alive():
             return
 
-        # Calculate alpha based on remaining time (fades out)
-        life_ratio = max(0.0, self.timer / self.duration) # Ensure float division
-        current_alpha = int(255 * life_ratio)
-
-        # Create color with current alpha
-        fade_color = (*self.initial_color, current_alpha)
-
-        # Convert world coordinates to screen coordinates using camera offset
-        screen_x, screen_y = camera.apply_coords(int(self.world_x), int(self.world_y))
-
-        # Create a temporary surface for alpha blending
-        temp_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(temp_surface, fade_color, (self.radius, self.radius), self.radius)
-
-        # Blit the temporary surface onto the main surface
-        surface.blit(temp_surface, (screen_x - self.radius, screen_y - self.radius))
+        cam_key = (camera.world_x, camera.world_y, camera.zoom_level)
+        if cam_key != self._last_cam:
+            self._last_cam = cam_key
+            # Skip indicators that lie entirely off-screen
+            left, top, right, bottom = camera.viewport_rect_world
+            world_radius = self.radius / camera.zoom_level
+            if (self.world_x + world_radius < left or self.world_x - world_radius > right or
+                    self.world_y + world_radius < top or self.world_y - world_radius > bottom):
+                self._screen = None
+            else:
+                # Convert world coordinates to screen coordinates using camera offset
+                self._screen = camera.apply_coords(self._ix, self._iy)
+        if self._screen is None:
+            return
+        screen_x, screen_y = self._screen
+
+        # Calculate alpha based on remaining time (fades out); the timer is
+        # positive here and never exceeds the duration
+        current_alpha = int(255 * self.timer * self._inv_duration)
+
+        _blit_circle(surface, self.initial_color, current_alpha, screen_x, screen_y, self.radius)
+
+
+# Circles up to this radius are scaled down from an antialiased template
+_SMALL_CIRCLE_RADIUS = 8
+_UNIT_CIRCLE: Optional[pygame.Surface] = None
+
+def _get_unit_circle() -> pygame.Surface:
+    """Get the white, antialiased 64x64 circle template, rendering it on first use.
+
+    Returns:
+        pygame.Surface: The template circle (radius 31, centered at 32, 32).
+    """
+    global _UNIT_CIRCLE
+    if _UNIT_CIRCLE is None:
+        _UNIT_CIRCLE = pygame.Surface((64, 64), pygame.SRCALPHA)
+        pygame.gfxdraw.filled_circle(_UNIT_CIRCLE, 32, 32, 31, WHITE)
+        pygame.gfxdraw.aacircle(_UNIT_CIRCLE, 32, 32, 31, WHITE)
+    return _UNIT_CIRCLE
+
+def _bucket_color(color: Tuple[int, ...]) -> Tuple[int, int, int]:
+    """Snap an interpolated color to one of 16 levels per channel.
+
+    Keeps the circle cache small for effects whose color changes every frame.
+
+    Args:
+        color (Tuple[int, ...]): The RGB color to snap.
+
+    Returns:
+        Tuple[int, int, int]: The center of the color's bucket.
+    """
+    return ((color[0] & 0xF0) | 0x08, (color[1] & 0xF0) | 0x08, (color[2] & 0xF0) | 0x08)
+
+# Opaque filled circles are cached per (radius, color); the fade is applied
+# per blit. Explosions sweep through many radius/color steps, so the cache is
+# bounded and the least recently used circles are dropped.
+@functools.lru_cache(maxsize=512)
+def _circle_surface(radius: int, color: Tuple[int, ...]) -> pygame.Surface:
+    """Render an opaque filled circle once for a (radius, color) pair.
+
+    Args:
+        radius (int): Radius of the circle in pixels.
+        color (Tuple[int, ...]): RGB color of the circle.
+
+    Returns:
+        pygame.Surface: The circle on a transparent square of side 2 * radius.
+    """
+    if radius <= _SMALL_CIRCLE_RADIUS:
+        # Tiny rasterised circles look blocky; scale down the smooth template
+        circle = pygame.transform.smoothscale(_get_unit_circle(), (radius * 2, radius * 2))
+        circle.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+    else:
+        circle = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(circle, color, (radius, radius), radius)
+    # Match the display's pixel format so blits take the fast path
+    if pygame.display.get_surface() is not None:
+        circle = circle.convert_alpha()
+    return circle
+
+def _blit_circle(surface: pygame.Surface, color: Tuple[int, ...], alpha: int,
+                 screen_x: int, screen_y: int, radius: int) -> None:
+    """Draw an alpha-blended filled circle centered on a screen point.
+
+    Args:
+        surface (pygame.Surface): The surface to draw on.
+        color (Tuple[int, ...]): RGB color of the circle.
+        alpha (int): Opacity of the circle (0-255).
+        screen_x (int): Screen x-coordinate of the center.
+        screen_y (int): Screen y-coordinate of the center.
+        radius (int): Radius of the circle in pixels.
+    """
+    circle = _circle_surface(radius, color)
+    circle.set_alpha(alpha)
+    surface.blit(circle, (screen_x - radius, screen_y - radius))
 
 
 # --- Explosion Effect --- 
@@ -161,12 +339,15 @@ class ExplosionEffect:
         """
         self.world_x = world_x
         self.world_y = world_y
+        self._ix = int(world_x) # Integer position for camera conversion, fixed for the effect's lifetime
+        self._iy = int(world_y)
         self.max_radius = max_radius
         self.duration = max(duration, 0.01) # Avoid division by zero
         self.start_color = start_color
         self.end_color = end_color
 
         self.timer = self.duration # Countdown timer
+        self._inv_duration = 1.0 / self.duration
         self.current_radius = 0
 
     def update(self, dt: float) -> None:
@@ -174,7 +355,7 @@ class ExplosionEffect:
         self.timer -= dt
         # Interpolate radius from 0 to max_radius based on time
         if self.duration > 0:
-            time_ratio = (self.duration - self.timer) / self.duration
+            time_ratio = 1.0 - self.timer * self._inv_duration
             self.current_radius = int(self.max_radius * time_ratio)
         else:
             self.current_radius = self.max_radius # Instantaneous if duration is 0
@@ -183,14 +364,24 @@ class ExplosionEffect:
         """Check if the explosion effect's timer has expired."""
         return self.timer <= 0
 
+    # The single removal check update_effects calls, looked up on the class
+    _is_dead = is_finished
+
     def draw(self, surface: pygame.Surface, camera: Camera) -> None:
         """Draw the expanding and fading explosion circle."""
         if self.is_finished():
             return
 
-        # Calculate progress ratio (0 = start, 1 = end)
-        progress_ratio = (self.duration - self.timer) / self.duration
-        progress_ratio = max(0.0, min(1.0, progress_ratio)) # Clamp between 0 and 1
+        # Skip explosions that lie entirely off-screen
+        left, top, right, bottom = camera.viewport_rect_world
+        world_radius = max(1, self.current_radius) / camera.zoom_level
+        if (self.world_x + world_radius < left or self.world_x - world_radius > right or
+                self.world_y + world_radius < top or self.world_y - world_radius > bottom):
+            return
+
+        # Calculate progress ratio (0 = start, 1 = end); the timer is positive
+        # here and never exceeds the duration, so no clamping is needed
+        progress_ratio = 1.0 - self.timer * self._inv_duration
 
         # Interpolate color
         current_color = (
@@ -201,21 +392,275 @@ class ExplosionEffect:
 
         # Calculate alpha (fades out towards the end)
         alpha = int(255 * (1.0 - progress_ratio))
-        alpha = max(0, min(255, alpha)) # Clamp alpha
-
-        # Final color with alpha
-        draw_color = (*current_color, alpha)
 
         # Convert world coordinates to screen coordinates
-        screen_x, screen_y = camera.apply_coords(int(self.world_x), int(self.world_y))
+        screen_x, screen_y = camera.apply_coords(self._ix, self._iy)
 
         # Draw the circle on a temporary surface for alpha blending
         radius = max(1, int(self.current_radius))
         if radius * 2 <= 0:
             return # Avoid zero-size surface
             
-        temp_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(temp_surface, draw_color, (radius, radius), radius)
+        _blit_circle(surface, _bucket_color(current_color), alpha, screen_x, screen_y, radius)
+
+
+# --- Pooled Effects ---
+
+class _EffectPool:
+    """Base class for effects stored as parallel NumPy arrays (one row per effect).
+
+    Subclasses list their per-effect arrays in `_FIELDS`. Live effects always
+    occupy rows `[0, n)`; expired rows are compacted away in `update`.
+    Arrays listed in `_OUTPUTS` are recomputed from the fields every update,
+    so they grow with the pool but are never compacted.
+
+    Arrays use the narrowest dtype that fits (float32 timers and positions,
+    uint8 colors, int16 sizes) to halve the bytes each frame's sweep touches.
+    float32 resolves world coordinates on the 4000x3000 map to well under
+    a thousandth of a pixel.
+    """
+    _FIELDS: Tuple[str, ...] = ()
+    _OUTPUTS: Tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        self.n = 0
+
+    def __len__(self) -> int:
+        """Return the number of live effects in the pool."""
+        return self.n
+
+    def _reserve_slot(self) -> int:
+        """Return the index of the next free row, doubling capacity when full."""
+        n = self.n
+        if n == self.timer.shape[0]:
+            for name in self._FIELDS + self._OUTPUTS:
+                old = getattr(self, name)
+                grown = np.empty((old.shape[0] * 2,) + old.shape[1:], dtype=old.dtype)
+                grown[:n] = old[:n]
+                setattr(self, name, grown)
+        self.n = n + 1
+        return n
+
+    def update(self, dt: float) -> None:
+        """Age every effect by dt and drop the ones whose timer ran out.
+
+        Args:
+            dt (float): Delta time in seconds.
+        """
+        n = self.n
+        if not n:
+            return
+        timer = self.timer[:n]
+        timer -= dt
+        keep = timer > 0
+        if keep.all():
+            return  # Nothing expired, no rows to move
+        # Gather the surviving rows to the front of every array in one pass
+        alive = np.flatnonzero(keep)
+        count = alive.shape[0]
+        for name in self._FIELDS:
+            arr = getattr(self, name)
+            arr[:count] = arr[alive]
+        self.n = count
+
+
+class AttackEffectPool(_EffectPool):
+    """All active attack beams, stored as parallel arrays instead of AttackEffect objects."""
+    _FIELDS = ('timer', 'duration', 'start', 'end', 'color', 'thickness')
+
+    def __init__(self, capacity: int = 64) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            capacity (int): Initial number of beam slots; the pool grows as needed.
+        """
+        super().__init__()
+        self.timer = np.empty(capacity, dtype=np.float32)
+        self.duration = np.empty(capacity, dtype=np.float32)
+        self.start = np.empty((capacity, 2), dtype=np.float32)
+        self.end = np.empty((capacity, 2), dtype=np.float32)
+        self.color = np.empty((capacity, 3), dtype=np.uint8)
+        self.thickness = np.empty(capacity, dtype=np.int16)
+
+    def spawn(self, start_pos: Tuple[float, float], end_pos: Tuple[float, float],
+              color: Tuple[int, int, int] = BRIGHT_YELLOW, duration: float = 0.15,
+              thickness: int = 3) -> None:
+        """Add a beam to the pool. Takes the same arguments as AttackEffect.
+
+        Args:
+            start_pos (Tuple[float, float]): World coordinates of the beam start.
+            end_pos (Tuple[float, float]): World coordinates of the beam end.
+            color (Tuple[int, int, int]): Color of the beam glow.
+            duration (float): How long the beam lasts in seconds.
+            thickness (int): Thickness of the beam core.
+        """
+        if duration <= 0:
+            return  # Would never be visible
+        i = self._reserve_slot()
+        self.timer[i] = duration
+        self.duration[i] = duration
+        self.start[i] = start_pos
+        self.end[i] = end_pos
+        self.color[i] = color[:3]
+        self.thickness[i] = thickness
+
+    def add(self, effect: AttackEffect) -> None:
+        """Move an AttackEffect returned by a unit update into the pool.
+
+        Args:
+            effect (AttackEffect): The effect to copy into the pool.
+        """
+        if effect.timer <= 0:
+            return
+        self.spawn(effect.start_pos, effect.end_pos, effect.color, effect.duration, effect.thickness)
+        self.timer[self.n - 1] = effect.timer
+
+    def draw_all(self, surface: pygame.Surface, camera: Camera) -> None:
+        """Draw every live beam.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            camera (Camera): The camera used for world-to-screen conversion.
+        """
+        n = self.n
+        if not n:
+            return
+        # Square the ratio to make beams fade faster towards the end
+        ratio = self.timer[:n] / self.duration[:n]
+        alphas = np.clip(ratio * ratio * 255, 0, 255).astype(np.uint8)
+
+        # Only draw visible beams whose bounding box (plus glow) overlaps the view
+        left, top, right, bottom = camera.viewport_rect_world
+        margin = _beam_margin(self.thickness[:n].astype(np.float32)) * np.float32(1.0 / camera.zoom_level)
+        start, end = self.start[:n], self.end[:n]
+        min_xy = np.minimum(start, end) - margin[:, None]
+        max_xy = np.maximum(start, end) + margin[:, None]
+        drawn = ((alphas > 0) & (max_xy[:, 0] >= left) & (min_xy[:, 0] <= right) &
+                 (max_xy[:, 1] >= top) & (min_xy[:, 1] <= bottom))
+
+        # Convert all endpoints to screen space in one pass each
+        screen_starts = camera.apply_coords_batch(self.start[:n]).tolist()
+        screen_ends = camera.apply_coords_batch(self.end[:n]).tolist()
+        colors = self.color[:n].tolist()
+        thicknesses = self.thickness[:n].tolist()
+        alpha_list = alphas.tolist()
+        for i in np.flatnonzero(drawn).tolist():
+            _draw_beam(surface, screen_starts[i], screen_ends[i],
+                       colors[i], alpha_list[i], thicknesses[i])
+
+
+def _step_explosions(timer: np.ndarray, duration: np.ndarray, max_radius: np.ndarray,
+                     start_color: np.ndarray, end_color: np.ndarray,
+                     out_radius: np.ndarray, out_rgba: np.ndarray) -> None:
+    """Compute the current radius and RGBA color of a batch of explosions.
+
+    Radius grows linearly from 0 to max_radius while the color moves from
+    start_color to end_color and the alpha fades from 255 to 0.
+
+    Args:
+        timer (np.ndarray): Remaining time of each explosion.
+        duration (np.ndarray): Total duration of each explosion.
+        max_radius (np.ndarray): Final radius of each explosion.
+        start_color (np.ndarray): (N, 3) uint8 start colors.
+        end_color (np.ndarray): (N, 3) uint8 end colors.
+        out_radius (np.ndarray): (N,) int16 array receiving the radii (at least 1).
+        out_rgba (np.ndarray): (N, 4) uint8 array receiving the colors.
+    """
+    # Progress ratio (0 = start, 1 = end)
+    progress = (duration - timer) / duration
+    np.clip(progress, 0.0, 1.0, out=progress)
+
+    out_radius[:] = max_radius * progress
+    np.maximum(out_radius, 1, out=out_radius)
+
+    start = start_color.astype(np.float32)
+    out_rgba[:, :3] = start + (end_color - start) * progress[:, None]
+    out_rgba[:, 3] = 255 * (1.0 - progress)
+
+
+class ExplosionPool(_EffectPool):
+    """All active explosions, stored as parallel arrays instead of ExplosionEffect objects."""
+    _FIELDS = ('timer', 'duration', 'pos', 'max_radius', 'start_color', 'end_color')
+    _OUTPUTS = ('radius', 'rgba')
+
+    def __init__(self, capacity: int = 32) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            capacity (int): Initial number of explosion slots; the pool grows as needed.
+        """
+        super().__init__()
+        self.timer = np.empty(capacity, dtype=np.float32)
+        self.duration = np.empty(capacity, dtype=np.float32)
+        self.pos = np.empty((capacity, 2), dtype=np.float32)
+        self.max_radius = np.empty(capacity, dtype=np.float32)
+        self.start_color = np.empty((capacity, 3), dtype=np.uint8)
+        self.end_color = np.empty((capacity, 3), dtype=np.uint8)
+        # Per-frame draw parameters, refreshed by update()
+        self.radius = np.empty(capacity, dtype=np.int16)
+        self.rgba = np.empty((capacity, 4), dtype=np.uint8)
+
+    def spawn(self, world_x: float, world_y: float,
+              max_radius: int = 50, duration: float = 0.5,
+              start_color: Tuple[int, int, int] = (255, 150, 0),
+              end_color: Tuple[int, int, int] = (100, 100, 100)) -> None:
+        """Add an explosion to the pool. Takes the same arguments as ExplosionEffect.
+
+        Args:
+            world_x (float): World x-coordinate for the explosion center.
+            world_y (float): World y-coordinate for the explosion center.
+            max_radius (int): The maximum radius the explosion reaches.
+            duration (float): How long the explosion lasts in seconds.
+            start_color (Tuple[int, int, int]): Color at the start of the explosion.
+            end_color (Tuple[int, int, int]): Color at the end of the explosion.
+        """
+        i = self._reserve_slot()
+        duration = max(duration, 0.01) # Avoid division by zero
+        self.timer[i] = duration
+        self.duration[i] = duration
+        self.pos[i] = (world_x, world_y)
+        self.max_radius[i] = max_radius
+        self.start_color[i] = start_color
+        self.end_color[i] = end_color
+        # Drawable before the first update: smallest, opaque, start color
+        self.radius[i] = 1
+        self.rgba[i] = (*start_color, 255)
 
-        # Blit onto the main surface
-        surface.blit(temp_surface, (screen_x - radius, screen_y - radius))
+    def update(self, dt: float) -> None:
+        """Age every explosion, drop finished ones and refresh radii and colors.
+
+        Args:
+            dt (float): Delta time in seconds.
+        """
+        super().update(dt)
+        n = self.n
+        if n:
+            _step_explosions(self.timer[:n], self.duration[:n], self.max_radius[:n],
+                             self.start_color[:n], self.end_color[:n],
+                             self.radius[:n], self.rgba[:n])
+
+    def draw_all(self, surface: pygame.Surface, camera: Camera) -> None:
+        """Draw every live explosion as an expanding, fading circle.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            camera (Camera): The camera used for world-to-screen conversion.
+        """
+        n = self.n
+        if not n:
+            return
+        # Only draw explosions that overlap the view
+        left, top, right, bottom = camera.viewport_rect_world
+        pos = self.pos[:n]
+        world_radius = self.radius[:n] * np.float32(1.0 / camera.zoom_level)
+        drawn = ((pos[:, 0] + world_radius >= left) & (pos[:, 0] - world_radius <= right) &
+                 (pos[:, 1] + world_radius >= top) & (pos[:, 1] - world_radius <= bottom))
+
+        screen_positions = camera.apply_coords_batch(pos).tolist()
+        # Snap colors to 16 levels per channel (see _bucket_color) to share cached circles
+        rgb_list = ((self.rgba[:n, :3] & 0xF0) | 0x08).tolist()
+        alpha_list = self.rgba[:n, 3].tolist()
+        radius_list = self.radius[:n].tolist()
+        for i in np.flatnonzero(drawn).tolist():
+            screen_x, screen_y = screen_positions[i]
+            _blit_circle(surface, tuple(rgb_list[i]), alpha_list[i], screen_x, screen_y, radius_list[i])
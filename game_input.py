@@ -2,11 +2,27 @@
 Game input handler for strategy game.
 Handles player inputs including keyboard and mouse commands.
 """
+import logging
+import types
 import pygame
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 from carrier import Carrier
 from units import FriendlyUnit
 
+logger = logging.getLogger(__name__)
+
+# Event types process_input reacts to; everything else (notably the frequent
+# MOUSEMOTION events) gets the shared empty result without any work
+_RELEVANT_EVENT_TYPES = frozenset({pygame.KEYDOWN})
+
+# Read-only result shared by every event that triggers nothing
+_EMPTY_RESULTS: Mapping[str, Any] = types.MappingProxyType({
+    'launched_fighter': None,
+    'command_processed': False,
+    'returning_fighters': False,
+    'launched_all': False
+})
+
 class GameInput:
     """
     Handles all player input for the game including keyboard and mouse actions.
@@ -19,6 +35,49 @@ class GameInput:
         self.carrier_launch_key = pygame.K_l  # 'L' key for launching fighters
         self.carrier_launch_all_key = pygame.K_a  # 'A' key for launching all fighters
         self.carrier_recall_key = pygame.K_r  # 'R' key for recalling fighters
+        
+        # Carrier key -> handler taking the carriers and returning a launched fighter (or None).
+        # Built from the key attributes above and rebuilt if they are rebound.
+        self._key_handlers: Dict[int, Callable[[List[Carrier]], Optional[FriendlyUnit]]] = {}
+        self._key_handler_keys: Optional[Tuple[int, int]] = None
+    
+    def _carrier_key_handlers(self) -> Dict[int, Callable[[List[Carrier]], Optional[FriendlyUnit]]]:
+        """Get the carrier key dispatch table for the current key bindings.
+        
+        Returns:
+            Dict[int, Callable]: Handlers keyed by the currently bound keys
+        """
+        keys = (self.carrier_launch_key, self.carrier_launch_all_key)
+        if keys != self._key_handler_keys:
+            self._key_handlers = {
+                self.carrier_launch_key: self._handle_launch,
+                self.carrier_launch_all_key: self._handle_launch_all,
+            }
+            self._key_handler_keys = keys
+        return self._key_handlers
+    
+    def _dispatch_carrier_key(self, event: pygame.event.Event, carriers: List[Carrier]
+                              ) -> Tuple[Optional[Callable[[List[Carrier]], Optional[FriendlyUnit]]],
+                                         Optional[FriendlyUnit]]:
+        """Run the carrier handler bound to a key event, if any.
+        
+        Args:
+            event: The pygame event to process
+            carriers: List of carrier objects in the game
+            
+        Returns:
+            Tuple of the handler that ran (None if the event triggers none) and
+            the fighter it launched (or None)
+        """
+        # Only process KEYDOWN events
+        if event.type != pygame.KEYDOWN:
+            return None, None
+        
+        # Dispatch to the handler for this key; other keys launch nothing
+        handler = self._carrier_key_handlers().get(event.key)
+        if handler is None:
+            return None, None
+        return handler, handler(carriers)
     
     def process_carrier_key_command(self, event: pygame.event.Event, carriers: List[Carrier], all_units: List = None) -> Optional[FriendlyUnit]:
         """
@@ -33,29 +92,40 @@ class GameInput:
             Optional[FriendlyUnit]: The launched fighter if a launch was triggered, None otherwise
                                     If multiple fighters are launched (launch_all), returns the first one
         """
-        # Only process KEYDOWN events
-        if event.type != pygame.KEYDOWN:
-            return None
-        
-        # Check for launch key
-        if event.key == self.carrier_launch_key:
-            # Find the first selected carrier
-            for carrier in carriers:
-                if carrier.selected:
-                    # Attempt to launch a fighter
-                    return carrier.launch_fighter()
+        return self._dispatch_carrier_key(event, carriers)[1]
+    
+    def _handle_launch(self, carriers: List[Carrier]) -> Optional[FriendlyUnit]:
+        """Launch a fighter from the first selected carrier.
         
-        # Check for launch all key
-        elif event.key == self.carrier_launch_all_key:
-            # Find the first selected carrier
-            for carrier in carriers:
-                if carrier.selected:
-                    # Queue all fighters for launch
-                    if carrier.launch_all_fighters():
-                        print(f"DEBUG: Queued all fighters for sequential launch with 'A' key")
-                        return None
+        Args:
+            carriers: Candidate carriers; only selected ones respond
+            
+        Returns:
+            Optional[FriendlyUnit]: The launched fighter, or None if none could launch
+        """
+        # Find the first selected carrier
+        for carrier in carriers:
+            if carrier.selected:
+                # Attempt to launch a fighter
+                return carrier.launch_fighter()
+        return None
+    
+    def _handle_launch_all(self, carriers: List[Carrier]) -> Optional[FriendlyUnit]:
+        """Queue every stored fighter of the first selected carrier that accepts it.
         
-        # No fighter was launched
+        Args:
+            carriers: Candidate carriers; only selected ones respond
+            
+        Returns:
+            None: Queued fighters launch later, from the carrier's launch queue
+        """
+        for carrier in carriers:
+            if carrier.selected:
+                # Queue all fighters for launch
+                if carrier.launch_all_fighters():
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Queued all fighters for sequential launch with 'A' key")
+                    return None
         return None
     
     def process_return_to_carrier_command(self, selected_units: List[FriendlyUnit], carrier: Carrier, target_pos: tuple) -> bool:
@@ -71,51 +141,56 @@ class GameInput:
             bool: True if the return command was successful for any unit, False otherwise
         """
         # Check if carrier has capacity for at least one fighter
-        if not carrier.can_land_fighter():
-            print(f"Carrier at maximum capacity: {len(carrier.stored_fighters)}/{carrier.fighter_capacity}")
+        if not carrier.can_land_fighter:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Carrier at maximum capacity: %s/%s",
+                             len(carrier.stored_fighters), carrier.fighter_capacity)
             return False
             
-        # Count how many fighters will be returning to this carrier
-        returning_fighters = []
+        # Only fighters can be ordered to return to carrier (not carriers themselves)
+        returning_fighters = [unit for unit in selected_units
+                              if isinstance(unit, FriendlyUnit) and unit != carrier]  # Prevent self-landing
+        if not returning_fighters:
+            return False
+        
+        # The approach point is the same for every fighter - directly in front of carrier
+        approach_distance = carrier.radius * 1.5  # Closer approach point
+        approach_x = carrier.world_x + approach_distance * carrier.get_direction_x()
+        approach_y = carrier.world_y + approach_distance * carrier.get_direction_y()
         
         # Mark each selected fighter to return to this carrier
-        for unit in selected_units:
-            # Only fighters can be ordered to return to carrier (not carriers themselves)
-            if isinstance(unit, FriendlyUnit) and unit != carrier:  # Prevent self-landing
-                # Store the carrier reference for landing checks
-                unit.target_carrier = carrier
-                unit.is_returning_to_carrier = True
-                
-                # Set the approach point - directly in front of carrier
-                approach_distance = carrier.radius * 1.5  # Closer approach point
-                approach_x = carrier.world_x + approach_distance * carrier.get_direction_x()
-                approach_y = carrier.world_y + approach_distance * carrier.get_direction_y()
-                
-                # Move to the approach point
-                unit.move_to_point(approach_x, approach_y)
-                
-                # Add to our tracking list
-                returning_fighters.append(unit)
-                
-                # Stop targeting enemies when returning to carrier
-                unit.target = None
-                
-                print(f"Fighter {id(unit)} ordered to return to carrier {id(carrier)}")
+        for unit in returning_fighters:
+            # Store the carrier reference for landing checks
+            unit.target_carrier = carrier
+            unit.is_returning_to_carrier = True
+            
+            # Move to the approach point
+            unit.move_to_point(approach_x, approach_y)
+            
+            # Stop targeting enemies when returning to carrier
+            unit.target = None
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Fighter %s ordered to return to carrier %s", id(unit), id(carrier))
         
-        # Return True if any fighters were commanded to return
-        return len(returning_fighters) > 0
+        return True
     
-    def process_input(self, event: pygame.event.Event, game_objects: dict) -> dict:
+    def process_input(self, event: pygame.event.Event, game_objects: dict) -> Mapping[str, Any]:
         """
         Process all game input events and update game state accordingly.
         
         Args:
             event: The pygame event to process
-            game_objects: Dictionary containing all game objects by category
+            game_objects: Dictionary containing all game objects by category. Carrier
+                          commands use 'selected_carriers' if present, else 'carriers'.
             
         Returns:
-            dict: Actions resulting from input processing
+            Mapping[str, Any]: Actions resulting from input processing. Events that
+                               trigger nothing share one read-only result.
         """
+        if event.type not in _RELEVANT_EVENT_TYPES:
+            return _EMPTY_RESULTS
+        
         results = {
             'launched_fighter': None,
             'command_processed': False,
@@ -123,15 +198,16 @@ class GameInput:
             'launched_all': False
         }
         
-        # Process carrier-specific commands if carriers exist
-        if 'carriers' in game_objects and game_objects['carriers']:
-            all_units = game_objects.get('all_units', [])
-            fighter = self.process_carrier_key_command(event, game_objects['carriers'], all_units)
+        # Process carrier-specific commands if carriers exist. Only selected
+        # carriers respond to keys, so prefer the selection's carriers when given.
+        carriers = game_objects.get('selected_carriers') or game_objects.get('carriers')
+        if carriers:
+            handler, fighter = self._dispatch_carrier_key(event, carriers)
             if fighter:
                 results['launched_fighter'] = fighter
                 results['command_processed'] = True
-                # Check if this was a launch_all command by checking if carrier has no more stored fighters
-                if event.type == pygame.KEYDOWN and event.key == self.carrier_launch_all_key:
+                # Report launch_all from the handler that ran, not a second key comparison
+                if handler == self._handle_launch_all:
                     results['launched_all'] = True
         
         return results
@@ -4,6 +4,8 @@ import math
 import random
 from typing import List, Any, Tuple, Optional, Dict, Union, Set
 
+import numpy as np
+
 # Import the specific Unit class without causing circular import
 from unit_mechanics import calculate_rotation, apply_rotation_inertia
 from units import Unit
@@ -12,6 +14,50 @@ from units import Unit
 BLUE = (0, 0, 255)
 RED = (255, 0, 0)
 
+# Below this many candidates a plain Python scan beats building NumPy arrays
+_VECTORIZE_MIN_UNITS = 16
+
+# Upper bound on the size of one block of the seeker x target distance matrix
+_NEAREST_BLOCK_ELEMENTS = 1 << 16
+
+
+def unit_positions(units: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """Gather unit positions into parallel x/y arrays.
+    
+    Build these once per frame to share them between many distance queries
+    against the same list of units.
+    
+    Args:
+        units: Units with world_x and world_y attributes
+        
+    Returns:
+        Tuple of (xs, ys) float64 arrays, in the order of units
+    """
+    count = len(units)
+    xs = np.fromiter((unit.world_x for unit in units), dtype=np.float64, count=count)
+    ys = np.fromiter((unit.world_y for unit in units), dtype=np.float64, count=count)
+    return xs, ys
+
+
+def _squared_distances(x: float, y: float, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Get the squared distance from a point to every position in xs/ys.
+    
+    Args:
+        x: X-coordinate of the point
+        y: Y-coordinate of the point
+        xs: X-coordinates to measure to
+        ys: Y-coordinates to measure to
+        
+    Returns:
+        Array of squared distances (comparing these avoids the square roots)
+    """
+    dx = xs - x
+    dy = ys - y
+    dx *= dx
+    dy *= dy
+    dx += dy
+    return dx
+
 
 def update_unit_movement(unit, dt: float) -> None:
     """Updates a unit's position based on its destination and speed.
@@ -32,48 +78,125 @@ def update_unit_movement(unit, dt: float) -> None:
     # Calculate vector to destination
     vector_x = target_x - current_x
     vector_y = target_y - current_y
-    distance = math.hypot(vector_x, vector_y)
+    distance_sq = vector_x * vector_x + vector_y * vector_y
     
-    # If already at destination (or very close), stop
-    if distance < 5:
+    # If already at destination (or very close), stop; checked before taking the root
+    if distance_sq < 25:
         return
+    distance = math.sqrt(distance_sq)
     
     # Calculate movement vector based on speed and delta time
     speed = unit.speed * dt
     if speed > distance:  # Don't overshoot
         speed = distance
         
-    # Move towards destination
-    if distance > 0:  # Avoid division by zero
-        move_vector_x = (vector_x / distance) * speed
-        move_vector_y = (vector_y / distance) * speed
-        unit.world_x += move_vector_x
-        unit.world_y += move_vector_y
+    # Move towards destination; one division scales both components
+    # (distance is at least 5 here, so it is never zero)
+    scale = speed / distance
+    unit.world_x += vector_x * scale
+    unit.world_y += vector_y * scale
 
 
-def find_closest_target(unit, potential_targets: List[Any]) -> Optional[Any]:
+def find_closest_target(unit, potential_targets: List[Any],
+                        positions: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Optional[Any]:
     """Find the closest target from a list of potential targets.
     
     Args:
         unit: The unit looking for a target (must have world_x and world_y attributes)
         potential_targets: List of potential targets (must have world_x and world_y attributes)
+        positions: Optional (xs, ys) arrays from unit_positions(potential_targets),
+                   to reuse across many queries in the same frame
         
     Returns:
         The closest target or None if the list is empty
     """
     if not potential_targets:
         return None
+    
+    unit_x, unit_y = unit.world_x, unit.world_y
+    
+    if positions is None and len(potential_targets) < _VECTORIZE_MIN_UNITS:
+        # Small lists: a direct scan on squared distances (same ordering, no sqrt)
+        closest_target = None
+        closest_distance_sq = float('inf')
+        for target in potential_targets:
+            dx = target.world_x - unit_x
+            dy = target.world_y - unit_y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < closest_distance_sq:
+                closest_target = target
+                closest_distance_sq = distance_sq
+        return closest_target
+    
+    # One vectorized pass; argmin returns the first of equally close targets,
+    # matching the scan above
+    xs, ys = positions if positions is not None else unit_positions(potential_targets)
+    return potential_targets[int(np.argmin(_squared_distances(unit_x, unit_y, xs, ys)))]
+
+
+def nearest_indices(xs: np.ndarray, ys: np.ndarray,
+                    target_xs: np.ndarray, target_ys: np.ndarray) -> np.ndarray:
+    """Find the index of the nearest target for each of many points at once.
+    
+    The distance matrix is built in row blocks so memory stays bounded no
+    matter how many points are queried.
+    
+    Args:
+        xs: X-coordinates of the query points
+        ys: Y-coordinates of the query points
+        target_xs: X-coordinates of the targets (must not be empty)
+        target_ys: Y-coordinates of the targets (must not be empty)
         
-    closest_target = None
-    closest_distance = float('inf')
+    Returns:
+        Integer array with, for each query point, the index of its closest
+        target (the first one on ties, like find_closest_target)
+    """
+    count = len(xs)
+    result = np.empty(count, dtype=np.intp)
+    rows = max(1, _NEAREST_BLOCK_ELEMENTS // len(target_xs))
+    for start in range(0, count, rows):
+        stop = min(start + rows, count)
+        dx = target_xs[None, :] - xs[start:stop, None]
+        dy = target_ys[None, :] - ys[start:stop, None]
+        dx *= dx
+        dy *= dy
+        dx += dy
+        np.argmin(dx, axis=1, out=result[start:stop])
+    return result
+
+
+def assign_closest_targets(units: List[Any], potential_targets: List[Any],
+                           positions: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> None:
+    """Point every idle unit in a list at its closest potential target.
     
-    for target in potential_targets:
-        distance = math.hypot(target.world_x - unit.world_x, target.world_y - unit.world_y)
-        if distance < closest_distance:
-            closest_target = target
-            closest_distance = distance
-            
-    return closest_target
+    This is the batched form of update_targeting for units that all pick from
+    the same target list: all idle units are resolved in one NumPy query
+    instead of one scan of the targets per unit.
+    
+    Args:
+        units: Units looking for targets; only idle ones with set_target are changed
+        potential_targets: Units they may target
+        positions: Optional (xs, ys) arrays from unit_positions(potential_targets)
+    """
+    if not potential_targets:
+        return
+    
+    seekers = [unit for unit in units
+               if unit.state == "idle" and hasattr(unit, 'set_target')]
+    if not seekers:
+        return
+    
+    if positions is None and len(potential_targets) < _VECTORIZE_MIN_UNITS:
+        # Few targets: per-unit scans are cheaper than setting up arrays
+        for unit in seekers:
+            unit.set_target(find_closest_target(unit, potential_targets))
+        return
+    
+    target_xs, target_ys = positions if positions is not None else unit_positions(potential_targets)
+    seeker_xs, seeker_ys = unit_positions(seekers)
+    closest = nearest_indices(seeker_xs, seeker_ys, target_xs, target_ys)
+    for unit, index in zip(seekers, closest.tolist()):
+        unit.set_target(potential_targets[index])
 
 
 def update_targeting(unit, friendly_units: List[Any], enemy_units: List[Any]) -> None:
@@ -103,6 +226,36 @@ def update_targeting(unit, friendly_units: List[Any], enemy_units: List[Any]) ->
         unit.set_target(closest_target)
 
 
+def update_targeting_batch(units: List[Any], friendly_units: List[Any], enemy_units: List[Any]) -> None:
+    """Update the targets of all idle units in one pass per side.
+    
+    Batched form of calling update_targeting for every unit: idle units are
+    split by type in a single pass, and each side's idle units are matched
+    against the other side in one query.
+    
+    Args:
+        units: Units whose targeting should be updated (e.g. all units)
+        friendly_units: List of friendly units (targets for enemies)
+        enemy_units: List of enemy units (targets for friendlies)
+    """
+    friendly_seekers = []
+    enemy_seekers = []
+    for unit in units:
+        if unit.state != "idle":
+            continue
+        if unit.type == 'friendly':
+            friendly_seekers.append(unit)
+        elif unit.type == 'enemy':
+            enemy_seekers.append(unit)
+    
+    # Each side's target positions are gathered at most once, and only when
+    # some unit of the other side is idle
+    if friendly_seekers:
+        assign_closest_targets(friendly_seekers, enemy_units)
+    if enemy_seekers:
+        assign_closest_targets(enemy_seekers, friendly_units)
+
+
 def check_attack_range(attacker: Any, target: Any) -> bool:
     """Check if target is within attacker's attack range.
     
@@ -116,9 +269,11 @@ def check_attack_range(attacker: Any, target: Any) -> bool:
     if not hasattr(attacker, 'attack_range'):
         return False
         
-    distance = math.hypot(target.world_x - attacker.world_x, 
-                          target.world_y - attacker.world_y)
-    return distance <= attacker.attack_range
+    # Compare squared lengths; no square root needed for an in-range test
+    dx = target.world_x - attacker.world_x
+    dy = target.world_y - attacker.world_y
+    attack_range = attacker.attack_range
+    return dx * dx + dy * dy <= attack_range * attack_range
 
 
 def perform_attack(attacker: Any, target: Any, dt: float) -> Optional[Any]:
@@ -193,42 +348,60 @@ def update_unit_attack(unit: Any, dt: float) -> Optional[Any]:
     return None
 
 
+def _effect_is_dead(effect: Any) -> bool:
+    """Check whether an effect without a _is_dead method has completed.
+    
+    Different effect types have different methods to check completion
+    (is_expired, is_finished, or is_alive).
+    
+    Args:
+        effect: Effect object to check
+        
+    Returns:
+        True if the effect should be removed
+    """
+    if hasattr(effect, 'is_expired') and effect.is_expired():
+        return True
+    if hasattr(effect, 'is_finished') and effect.is_finished():
+        return True
+    if hasattr(effect, 'is_alive') and not effect.is_alive():
+        return True  # Note inverted logic
+    return False
+
+
 def update_effects(effects: List[Any], dt: float) -> List[Any]:
     """Update all effects and remove those that have expired.
     
-    This function handles updating and cleaning up visual effects. It properly detects
-    different types of effects by checking for their specific completion methods 
-    (is_expired, is_finished, or is_alive).
+    This function handles updating and cleaning up visual effects. Effect
+    classes provide a class-level _is_dead method as their single completion
+    check; other objects fall back to their is_expired, is_finished, or
+    is_alive method.
+    
+    Expired effects are removed in place by swapping the last effect into
+    their slot, so no new list is allocated but the order of the remaining
+    effects may change.
     
     Args:
         effects: List of effect objects (must have update method and one of: 
-                is_expired, is_finished, or is_alive methods)
+                _is_dead, is_expired, is_finished, or is_alive methods)
         dt: Delta time in seconds
         
     Returns:
-        List of effects that are still active after updates
+        The same list, holding only the effects that are still active after updates
     """
-    if not effects:
-        return []
-        
-    active_effects = []
-    
-    for effect in effects:
-        # Update the effect
+    # Walk backwards so the effect swapped into a freed slot has already been updated
+    for i in range(len(effects) - 1, -1, -1):
+        effect = effects[i]
         effect.update(dt)
         
-        # Check if effect should be removed based on its completion state
-        # Different effect types might have different methods to check completion
-        if hasattr(effect, 'is_expired') and effect.is_expired():
-            continue  # Skip adding this effect to active list
-        elif hasattr(effect, 'is_finished') and effect.is_finished():
-            continue  # Skip adding this effect to active list
-        elif hasattr(effect, 'is_alive') and not effect.is_alive():
-            continue  # Skip adding this effect to active list (note inverted logic)
-            
-        active_effects.append(effect)
+        # Looked up on the class so stand-in objects without it use the fallback
+        is_dead = getattr(type(effect), '_is_dead', None)
+        if is_dead(effect) if is_dead is not None else _effect_is_dead(effect):
+            last = effects.pop()
+            if i < len(effects):
+                effects[i] = last
         
-    return active_effects
+    return effects
 
 
 def detect_unit_collision(unit1: Any, unit2: Any) -> bool:
@@ -254,12 +427,13 @@ def detect_unit_collision(unit1: Any, unit2: Any) -> bool:
     if hasattr(unit2, 'collision_enabled') and not unit2.collision_enabled:
         return False
     
-    # Calculate distance between centers
-    distance = math.hypot(unit2.world_x - unit1.world_x, 
-                          unit2.world_y - unit1.world_y)
+    # Calculate squared distance between centers
+    dx = unit2.world_x - unit1.world_x
+    dy = unit2.world_y - unit1.world_y
     
-    # Check if distance is less than or equal to sum of radii
-    return distance <= (unit1.radius + unit2.radius)
+    # Check if distance is less than or equal to sum of radii (both sides squared)
+    reach = unit1.radius + unit2.radius
+    return dx * dx + dy * dy <= reach * reach
 
 
 def find_enemies_in_radius(click_pos: Tuple[float, float], enemy_units: List[Any], radius: float) -> List[Any]:
@@ -279,23 +453,10 @@ def find_enemies_in_radius(click_pos: Tuple[float, float], enemy_units: List[Any
     if not enemy_units:
         return []
     
-    click_x, click_y = click_pos
-    units_in_radius = []
-    
-    for enemy in enemy_units:
-        # Get the center position of the enemy unit
-        enemy_rect = enemy.get_rect()
-        enemy_center_x = enemy.world_x
-        enemy_center_y = enemy.world_y
-        
-        # Calculate distance from click point to enemy center
-        distance = math.hypot(enemy_center_x - click_x, enemy_center_y - click_y)
-        
-        # If within radius, add to result list
-        if distance <= radius:
-            units_in_radius.append(enemy)
-    
-    return units_in_radius
+    # Compare squared distances from the click point to every enemy center at once
+    xs, ys = unit_positions(enemy_units)
+    in_radius = _squared_distances(click_pos[0], click_pos[1], xs, ys) <= radius * radius
+    return [enemy_units[i] for i in np.flatnonzero(in_radius).tolist()]
 
 
 def get_closest_enemy_to_point(click_pos: Tuple[float, float], enemy_units: List[Any]) -> Optional[Any]:
@@ -314,25 +475,9 @@ def get_closest_enemy_to_point(click_pos: Tuple[float, float], enemy_units: List
     if not enemy_units:
         return None
     
-    click_x, click_y = click_pos
-    closest_enemy = None
-    min_distance = float('inf')
-    
-    for enemy in enemy_units:
-        # Get the center position of the enemy unit
-        enemy_rect = enemy.get_rect()
-        enemy_center_x = enemy.world_x
-        enemy_center_y = enemy.world_y
-        
-        # Calculate distance from click point to enemy center
-        distance = math.hypot(enemy_center_x - click_x, enemy_center_y - click_y)
-        
-        # Update closest enemy if this one is closer
-        if distance < min_distance:
-            min_distance = distance
-            closest_enemy = enemy
-    
-    return closest_enemy
+    # The first of equally close enemies wins, as with a sequential scan
+    xs, ys = unit_positions(enemy_units)
+    return enemy_units[int(np.argmin(_squared_distances(click_pos[0], click_pos[1], xs, ys)))]
 
 
 def resolve_collision_with_mass(unit1: Unit, unit2: Unit, use_mass: bool = False) -> None:
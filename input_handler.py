@@ -244,8 +244,9 @@ class InputHandler:
 
             # --- Keyboard Events for Carrier Operations ---
             elif event.type == pygame.KEYDOWN:
-                # Filter the carrier units from all_units
-                carriers = [unit for unit in all_units if isinstance(unit, Carrier)]
+                # Only selected carriers react to carrier keys, so take them from the
+                # selection list instead of scanning every unit in the game
+                carriers = [unit for unit in selected_units if isinstance(unit, Carrier)]
                 
                 # Process carrier keyboard commands
                 fighter = self.game_input.process_carrier_key_command(event, carriers, all_units)
@@ -5,8 +5,9 @@ import pygame
 from parallax_background import ParallaxBackground
 from camera import Camera
 from constants import *  # Import all constants
-from effects import DestinationIndicator, ExplosionEffect  # Import the effect classes
-from game_logic import update_targeting, update_effects, detect_unit_collision, resolve_collision_with_mass
+from effects import DestinationIndicator, AttackEffectPool, ExplosionPool  # Import the effect classes
+from game_logic import update_targeting_batch, update_effects
+from collisions import resolve_unit_collisions
 from input_handler import InputHandler  # Import the new handler
 from ui import UnitInfoPanel, CarrierPanel  # Import both UI panels
 from units import Unit, FriendlyUnit, EnemyUnit  # Import all unit classes for type checking
@@ -34,7 +35,8 @@ def main() -> None:
     # Create UI components
     unit_info_panel = UnitInfoPanel(SCREEN_WIDTH)
     carrier_panel = CarrierPanel(SCREEN_WIDTH)
-    effects: list = [] # List to hold all active effects (attack, explosion, etc.)
+    attack_effects = AttackEffectPool() # All active attack beams
+    explosions = ExplosionPool() # All active explosions
     
     # --- Create Input Handler ---
     input_handler = InputHandler()
@@ -83,6 +85,10 @@ def main() -> None:
     drag_start_pos: tuple[int, int] | None = None
     drag_current_pos: tuple[int, int] | None = None # Keep track for drawing
 
+    # Minimap layout as locals for the per-frame minimap drawing
+    mini_scale_x, mini_scale_y, minimap_x, minimap_y, minimap_width, minimap_height = MINIMAP_PARAMS
+    mini_cell_size = max(1, int(visibility_grid.cell_size * mini_scale_x))
+
     while running:
         # --- Delta Time Calculation ---
         # dt = time difference between frames in seconds. Crucial for frame-rate independent movement.
@@ -163,18 +169,18 @@ def main() -> None:
         # Find all carriers and process their launch queues
         for unit in all_units:
             if isinstance(unit, Carrier) and unit.launch_queue:
-                # Process the launch queue
-                launched_fighter = unit.process_launch_queue(all_units)
+                # Process the launch queue; a long frame can launch several fighters
+                launched_fighters = unit.process_launch_queue(all_units, dt)
                 
-                # If a fighter was launched, add it to friendly_units and create launch effect
-                if launched_fighter:
+                # Add each launched fighter to friendly_units and create its launch effect
+                for launched_fighter in launched_fighters:
                     # Add to friendly units if not already there
                     if launched_fighter not in friendly_units:
                         friendly_units.append(launched_fighter)
                         print(f"DEBUG: Added newly launched fighter to friendly_units")
                     
                     # Create an explosion effect at the fighter's position
-                    launch_explosion = ExplosionEffect(
+                    explosions.spawn(
                         world_x=launched_fighter.world_x,
                         world_y=launched_fighter.world_y,
                         max_radius=launched_fighter.radius * 2,
@@ -182,7 +188,6 @@ def main() -> None:
                         start_color=(100, 200, 255),  # Blue-ish
                         end_color=(200, 230, 255)     # Light blue
                     )
-                    effects.append(launch_explosion)
                     print(f"DEBUG: Created launch explosion at ({launched_fighter.world_x}, {launched_fighter.world_y})")
                 
                 # Check for any other newly added fighters
@@ -194,13 +199,14 @@ def main() -> None:
         # --- Process Carrier Landing Queues ---
         # Find all carriers and process their landing queues
         for unit in all_units:
-            if isinstance(unit, Carrier) and hasattr(unit, 'landing_queue') and unit.landing_queue:
+            if isinstance(unit, Carrier) and unit.landing_queue:
                 # Process the landing queue
-                unit.process_landing_queue(all_units)
+                unit.process_landing_queue(all_units, dt)
         
         # --- Update Effects ---
-        # Use game_logic.update_effects to update and clean up expired effects
-        effects = update_effects(effects, dt)
+        # The pools age and drop expired effects in one vectorized pass each
+        attack_effects.update(dt)
+        explosions.update(dt)
 
         # --- Update Destination Indicators ---
         destination_indicators = update_effects(destination_indicators, dt)
@@ -210,7 +216,7 @@ def main() -> None:
         for unit in all_units:
             effect = unit.update(dt)
             if effect: # If unit update returned an effect (e.g., attack)
-                effects.append(effect)
+                attack_effects.add(effect)
                 
             # Check if fighter has completed landing and been stored in a carrier
             if isinstance(unit, FriendlyUnit) and hasattr(unit, 'landing_complete'):
@@ -225,9 +231,6 @@ def main() -> None:
                         if unit in friendly_units:
                             friendly_units.remove(unit)
 
-            # Use game_logic module for unit targeting
-            update_targeting(unit, friendly_units, enemy_units)
-
             for unit_other in all_units:
                 # Check if unit's HP dropped to zero or below AFTER update
                 if unit_other.hp <= 0:
@@ -235,12 +238,20 @@ def main() -> None:
                     if unit_other not in units_to_remove:
                         units_to_remove.append(unit_other)
         
+        # --- Carrier Collision Warnings ---
+        # Rebuild the shared grid once; each carrier only checks the units around it
+        Carrier.rebuild_unit_grid(all_units)
+        for unit in all_units:
+            if isinstance(unit, Carrier):
+                unit.update_proximity_and_collision(unit.nearby_units())
+
+        # --- Update Targeting ---
+        # Idle units of each side pick their closest opponent in one batched query
+        update_targeting_batch(all_units, friendly_units, enemy_units)
+
         # --- Handle Unit Collisions ---
         # Detect and resolve collisions between all units to prevent overlap
-        for i, unit1 in enumerate(all_units):
-            for unit2 in all_units[i+1:]:  # Only check each pair once
-                if detect_unit_collision(unit1, unit2):
-                    resolve_collision_with_mass(unit1, unit2)
+        resolve_unit_collisions(all_units)
  
          # Handle destroyed units
         if units_to_remove:
@@ -249,7 +260,7 @@ def main() -> None:
             print(f"DEBUG Attempting to remove unit {id(unit)}...") # DEBUG
             
             # Create an explosion effect at the unit's position
-            explosion = ExplosionEffect(
+            explosions.spawn(
                 world_x=unit.world_x,
                 world_y=unit.world_y,
                 max_radius=unit.radius * 3,  # Make explosion larger than the unit
@@ -257,7 +268,6 @@ def main() -> None:
                 start_color=(255, 165, 0),  # Orange
                 end_color=(100, 20, 20)  # Dark red
             )
-            effects.append(explosion)
             
             # Manually remove from all relevant lists
             if unit in all_units:
@@ -284,9 +294,13 @@ def main() -> None:
         visibility_grid.draw_fog_of_war(screen, camera)
 
         # --- Draw Units ---
-        # Draw all friendly units
+        # Draw all carriers in one batched pass (shares rotated sprites)
+        Carrier.draw_all([unit for unit in friendly_units if isinstance(unit, Carrier)], screen, camera)
+
+        # Draw all other friendly units
         for unit in friendly_units:
-            unit.draw(screen, camera)
+            if not isinstance(unit, Carrier):
+                unit.draw(screen, camera)
             
         # Draw only visible enemy units
         for unit in visible_enemies:
@@ -294,8 +308,8 @@ def main() -> None:
             
         # --- Draw Effects ---
         # Draw all active effects
-        for effect in effects:
-            effect.draw(screen, camera)
+        attack_effects.draw_all(screen, camera)
+        explosions.draw_all(screen, camera)
 
         # --- Draw Destination Indicators ---
         for indicator in destination_indicators:
@@ -332,11 +346,11 @@ def main() -> None:
 
         # --- Draw Minimap ---
         # Create a surface for the minimap with per-pixel alpha
-        minimap_surface = pygame.Surface((MINIMAP_WIDTH, MINIMAP_HEIGHT), pygame.SRCALPHA)
+        minimap_surface = pygame.Surface((minimap_width, minimap_height), pygame.SRCALPHA)
         minimap_surface.fill(MINIMAP_BG_COLOR)
         
         # Draw fog of war on minimap
-        fog_overlay = pygame.Surface((MINIMAP_WIDTH, MINIMAP_HEIGHT), pygame.SRCALPHA)
+        fog_overlay = pygame.Surface((minimap_width, minimap_height), pygame.SRCALPHA)
         
         # Draw areas in fog based on visibility grid
         for grid_x in range(visibility_grid.grid_width):
@@ -347,9 +361,8 @@ def main() -> None:
                 # Calculate minimap position for this cell
                 cell_world_x = grid_x * visibility_grid.cell_size
                 cell_world_y = grid_y * visibility_grid.cell_size
-                mini_x = int((cell_world_x / MAP_WIDTH) * MINIMAP_WIDTH)
-                mini_y = int((cell_world_y / MAP_HEIGHT) * MINIMAP_HEIGHT)
-                mini_cell_size = max(1, int((visibility_grid.cell_size / MAP_WIDTH) * MINIMAP_WIDTH))
+                mini_x = int(cell_world_x * mini_scale_x)
+                mini_y = int(cell_world_y * mini_scale_y)
                 
                 # Draw different fog colors based on visibility state
                 if state == VisibilityState.UNSEEN:
@@ -363,14 +376,14 @@ def main() -> None:
         
         # Draw friendly units on minimap (always visible)
         for unit in friendly_units:
-            mini_x = int((unit.world_x / MAP_WIDTH) * MINIMAP_WIDTH)
-            mini_y = int((unit.world_y / MAP_HEIGHT) * MINIMAP_HEIGHT)
+            mini_x = int(unit.world_x * mini_scale_x)
+            mini_y = int(unit.world_y * mini_scale_y)
             pygame.draw.circle(minimap_surface, unit.color, (mini_x, mini_y), 2)
             
         # Draw enemy units on minimap only if visible
         for unit in visible_enemies:
-            mini_x = int((unit.world_x / MAP_WIDTH) * MINIMAP_WIDTH)
-            mini_y = int((unit.world_y / MAP_HEIGHT) * MINIMAP_HEIGHT)
+            mini_x = int(unit.world_x * mini_scale_x)
+            mini_y = int(unit.world_y * mini_scale_y)
             pygame.draw.circle(minimap_surface, unit.color, (mini_x, mini_y), 2)
             
         # Apply fog of war to minimap
@@ -378,10 +391,10 @@ def main() -> None:
 
         # Draw camera view rectangle on minimap
         cam_rect_world = camera.get_world_view() # Use the new method
-        cam_rect_mini_x = int((cam_rect_world.left * MINIMAP_SCALE_X)) # Use world_view properties and scaling factors
-        cam_rect_mini_y = int((cam_rect_world.top * MINIMAP_SCALE_Y))
-        cam_rect_mini_width = int((cam_rect_world.width * MINIMAP_SCALE_X))
-        cam_rect_mini_height = int((cam_rect_world.height * MINIMAP_SCALE_Y))
+        cam_rect_mini_x = int((cam_rect_world.left * mini_scale_x)) # Use world_view properties and scaling factors
+        cam_rect_mini_y = int((cam_rect_world.top * mini_scale_y))
+        cam_rect_mini_width = int((cam_rect_world.width * mini_scale_x))
+        cam_rect_mini_height = int((cam_rect_world.height * mini_scale_y))
         
         camera_view_rect_mini = pygame.Rect(cam_rect_mini_x, cam_rect_mini_y, 
                                           max(1, cam_rect_mini_width), max(1, cam_rect_mini_height)) # Ensure minimum size of 1x1
@@ -391,7 +404,7 @@ def main() -> None:
         pygame.draw.rect(minimap_surface, (200, 200, 200), minimap_surface.get_rect(), 1)
         
         # Blit the minimap surface onto the main screen
-        screen.blit(minimap_surface, (MINIMAP_X, MINIMAP_Y))
+        screen.blit(minimap_surface, (minimap_x, minimap_y))
         
         # Fog of war is now drawn before UI elements and after background
 
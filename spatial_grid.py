@@ -0,0 +1,110 @@
+"""Uniform spatial grid for broad-phase neighbour queries.
+
+Units are bucketed by the grid cell containing their position so that a
+query only has to look at the units in the few cells around a point instead
+of every unit in the game, and collision pairs only have to be tested
+between units in the same or adjacent cells.
+"""
+from typing import Dict, Iterator, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from units import Unit
+
+
+# Neighbouring cells checked from each cell when pairing. Together with the
+# cell itself these cover all 8 neighbours exactly once across the grid.
+_FORWARD_NEIGHBOURS = ((1, 0), (1, 1), (0, 1), (-1, 1))
+
+
+class SpatialGrid:
+    """Buckets units into square cells keyed by integer cell coordinates."""
+    def __init__(self, cell_size: float) -> None:
+        """Initialize an empty grid.
+
+        Args:
+            cell_size (float): Side length of one grid cell in world units.
+                For query_pairs it must be at least the largest distance at
+                which two units count as neighbours (e.g. twice the largest
+                radius for collisions).
+        """
+        self.cell_size = cell_size
+        self.units: List['Unit'] = []
+        # Cells hold indices into self.units
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def rebuild(self, units: List['Unit']) -> None:
+        """Re-bucket every unit by its current position.
+
+        Call this once per frame, before any queries for that frame.
+
+        Args:
+            units (List[Unit]): All units that should be found by queries;
+                query_pairs yields indices into this list.
+        """
+        cell_size = self.cell_size
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        for index, unit in enumerate(units):
+            key = (int(unit.world_x // cell_size), int(unit.world_y // cell_size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [index]
+            else:
+                bucket.append(index)
+        self.units = units
+        self.cells = cells
+
+    def query(self, x: float, y: float, radius: float) -> List['Unit']:
+        """Get the units in every cell overlapping a square around a point.
+
+        The result is a broad-phase candidate list: it contains every unit
+        within `radius` of the point, plus some that are slightly further.
+
+        Args:
+            x (float): World x-coordinate of the query center.
+            y (float): World y-coordinate of the query center.
+            radius (float): Search radius in world units.
+
+        Returns:
+            List[Unit]: Candidate units near the point.
+        """
+        cell_size = self.cell_size
+        min_cx = int((x - radius) // cell_size)
+        max_cx = int((x + radius) // cell_size)
+        min_cy = int((y - radius) // cell_size)
+        max_cy = int((y + radius) // cell_size)
+
+        cells = self.cells
+        units = self.units
+        found: List['Unit'] = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend([units[index] for index in bucket])
+        return found
+
+    def query_pairs(self) -> Iterator[Tuple[int, int]]:
+        """Yield every pair of units sharing a cell or in adjacent cells.
+
+        Each candidate pair is yielded once, as indices (i, j) into the list
+        passed to rebuild with i < j, in no particular order.
+
+        Returns:
+            Iterator[Tuple[int, int]]: Broad-phase candidate index pairs.
+        """
+        cells = self.cells
+        for (cx, cy), bucket in cells.items():
+            size = len(bucket)
+            # Indices are appended in increasing order, so i < j within a bucket
+            for a in range(size):
+                i = bucket[a]
+                for b in range(a + 1, size):
+                    yield i, bucket[b]
+
+            for ox, oy in _FORWARD_NEIGHBOURS:
+                other = cells.get((cx + ox, cy + oy))
+                if not other:
+                    continue
+                for i in bucket:
+                    for j in other:
+                        yield (i, j) if i < j else (j, i)
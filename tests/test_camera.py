@@ -0,0 +1,31 @@
+"""Tests for the Camera class in camera.py."""
+
+import numpy as np
+import sys
+import os
+
+# Add the parent directory to the path so we can import from the main package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from camera import Camera
+
+class TestCamera:
+    def test_apply_coords_batch_matches_apply_coords(self):
+        """Test that the batched transform agrees with apply_coords, including zoom."""
+        camera = Camera(800, 600)
+        camera.world_x, camera.world_y = 120.0, 45.0
+        camera.zoom_level = 1.5
+        points = [(130, 50), (500, 400), (120, 45), (1000, 20)]
+
+        batch = camera.apply_coords_batch(np.array(points, dtype=np.float32))
+
+        assert batch.dtype == np.int32
+        assert [tuple(p) for p in batch.tolist()] == [camera.apply_coords(x, y) for x, y in points]
+
+    def test_viewport_rect_world_accounts_for_zoom(self):
+        """Test that the visible world area shrinks as the camera zooms in."""
+        camera = Camera(800, 600)
+        camera.world_x, camera.world_y = 100.0, 50.0
+        camera.zoom_level = 2.0
+
+        assert camera.viewport_rect_world == (100.0, 50.0, 500.0, 350.0)
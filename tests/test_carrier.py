@@ -73,3 +73,144 @@ class TestCarrier:
             
             # Verify the camera was called with expected parameters
             mock_camera.apply_coords.assert_called_once_with(100, 100)  # The carrier's position
+
+    def test_carrier_draw_all_shares_rotated_sprite(self):
+        """Test that draw_all rotates a shared sprite once per rotation key."""
+        # Copy so no earlier test has filled the rotation table for this sprite
+        sprite = get_carrier_sprite().copy()
+        carriers = [Carrier(world_x=100 + i * 50, world_y=100) for i in range(3)]
+        for carrier in carriers:
+            carrier.sprite = sprite
+        
+        mock_surface = pygame.Surface((400, 300))
+        mock_camera = MagicMock()
+        mock_camera.apply_coords.return_value = (50, 50)
+        
+        with patch('pygame.transform.rotate', wraps=pygame.transform.rotate) as mock_rotate:
+            Carrier.draw_all(carriers, mock_surface, mock_camera)
+        
+        # All carriers share one sprite and heading, so one rotation is enough
+        assert mock_rotate.call_count == 1
+        assert mock_camera.apply_coords.call_count == len(carriers)
+
+    def test_carrier_draw_skips_off_screen(self):
+        """Test that a carrier far outside the screen is culled before rotation."""
+        carrier = Carrier(world_x=100, world_y=100)
+        
+        mock_surface = pygame.Surface((100, 100))
+        mock_camera = MagicMock()
+        mock_camera.apply_coords.return_value = (-10000, -10000)
+        
+        with patch('pygame.transform.rotate') as mock_rotate:
+            carrier.draw(mock_surface, mock_camera)
+        
+        mock_rotate.assert_not_called()
+
+    def test_carrier_draw_keeps_indicators_reaching_on_screen(self):
+        """Test that a carrier just off-screen still draws landing/launch arrows that reach the screen."""
+        from carrier import OperationIndicator
+        from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        mock_camera = MagicMock()
+        
+        # Launch arrow points right (rotation 0) from a carrier left of the screen
+        launching = Carrier(world_x=100, world_y=100)
+        launching.rotation = 0
+        launching.operation_indicators = [OperationIndicator(type='launch_indicator')]
+        mock_camera.apply_coords.return_value = (-200, SCREEN_HEIGHT // 2)
+        with patch('pygame.draw.line') as mock_line:
+            launching.draw(surface, mock_camera)
+        mock_line.assert_called()
+        
+        # Landing approach arrow trails behind a carrier right of the screen
+        landing = Carrier(world_x=100, world_y=100)
+        landing.rotation = 0
+        landing.landing_queue.append(MagicMock())
+        landing.operation_indicators = [
+            OperationIndicator(type='landing_zone', radius=landing.landing_zone_radius)]
+        mock_camera.apply_coords.return_value = (SCREEN_WIDTH + 250, SCREEN_HEIGHT // 2)
+        with patch('pygame.draw.line') as mock_line:
+            landing.draw(surface, mock_camera)
+        mock_line.assert_called()
+
+    def test_carrier_draw_reuses_last_rotated_frame(self):
+        """Test that a carrier with an unchanged heading skips the rotation lookup."""
+        import carrier as carrier_module
+        carrier = Carrier(world_x=100, world_y=100)
+        
+        mock_surface = pygame.Surface((800, 600))
+        mock_camera = MagicMock()
+        mock_camera.apply_coords.return_value = (100, 100)
+        
+        with patch.object(carrier_module, '_get_rotated_sprite',
+                          wraps=carrier_module._get_rotated_sprite) as mock_lookup:
+            carrier.draw(mock_surface, mock_camera)
+            carrier.draw(mock_surface, mock_camera)
+            assert mock_lookup.call_count == 1
+            
+            carrier.rotation += 90
+            carrier.draw(mock_surface, mock_camera)
+            assert mock_lookup.call_count == 2
+
+    def test_carrier_sprite_loaded_once_display_exists(self):
+        """Test that the carrier sprite is loaded once and then reused."""
+        import carrier as carrier_module
+        loaded = pygame.Surface((240, 80), pygame.SRCALPHA)
+        
+        with patch.object(carrier_module, '_CACHED_CARRIER_SPRITE', None), \
+             patch('pygame.display.get_surface', return_value=MagicMock()), \
+             patch('carrier.load_image', return_value=loaded) as mock_load:
+            assert get_carrier_sprite() is loaded
+            assert get_carrier_sprite() is loaded
+        
+        mock_load.assert_called_once()
+
+    def test_arrow_points_heading_right(self):
+        """Test the indicator arrow vertices for a carrier heading along +x."""
+        from carrier import _arrow_points
+        start, end, head1, head2 = _arrow_points(100, 100, 1.0, 0.0, 10, 50, 20)
+        
+        assert start == pytest.approx((110, 100))
+        assert end == pytest.approx((150, 100))
+        # Head edges trail the tip symmetrically at 30 degrees
+        assert head1 == pytest.approx((150 - 20 * 0.8660254, 110))
+        assert head2 == pytest.approx((150 - 20 * 0.8660254, 90))
+
+    def test_restriction_indicator_is_typed_and_drawable(self):
+        """Test that restriction indicators are OperationIndicator objects that draw cleanly."""
+        from carrier import OperationIndicator
+        pygame.init()  # Other test modules shut pygame down in their teardown
+        carrier = Carrier(world_x=100, world_y=100)
+        carrier.movement_restricted = True
+        carrier.restriction_reason = "Launching"
+        carrier._update_operation_indicators(0.1)
+        
+        indicator = carrier.operation_indicators[0]
+        assert isinstance(indicator, OperationIndicator)
+        assert indicator.type == 'restriction_indicator'
+        assert indicator.reason == "Launching"
+        
+        mock_surface = pygame.Surface((400, 300))
+        mock_camera = MagicMock()
+        mock_camera.apply_coords.return_value = (200, 150)
+        carrier.draw(mock_surface, mock_camera)
+
+    def test_unchanged_restriction_only_advances_indicator_pulse(self):
+        """Test that an unchanged restriction keeps its indicator and only updates the pulse."""
+        carrier = Carrier(world_x=100, world_y=100)
+        carrier.movement_restricted = True
+        carrier.restriction_reason = "Landing"
+        carrier._update_operation_indicators(0.1)
+        indicator = carrier.operation_indicators[0]
+        
+        carrier._update_operation_indicators(0.5)
+        assert carrier.operation_indicators == [indicator]
+        assert indicator.pulse_timer == 0.25
+        
+        # A new reason or a lifted restriction is picked up on the next call
+        carrier.restriction_reason = "Launching"
+        carrier._update_operation_indicators(0.1)
+        assert indicator.reason == "Launching"
+        carrier.movement_restricted = False
+        carrier._update_operation_indicators(0.1)
+        assert carrier.operation_indicators == []
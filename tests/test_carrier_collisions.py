@@ -106,10 +106,63 @@ class TestCarrierCollisions:
         assert is_imminent, "Should detect imminent collision"
         
         # Check that the unit was added to collision warnings list
-        assert unit in carrier.collision_warnings, "Unit should be in collision warnings list"
+        assert unit in carrier.collision_warnings, "Unit should be in collision warnings"
         
         # Test with a unit moving away
         unit2 = FriendlyUnit(world_x=150, world_y=100)
         unit2.velocity_x = 50  # Moving away from carrier
         is_imminent = carrier.predict_collision(unit2)
         assert not is_imminent, "Should not detect collision for unit moving away"
+
+    def test_predict_collision_rejects_distant_units(self):
+        """Test that a distant moving unit is rejected and cleared from warnings."""
+        carrier = Carrier(world_x=100, world_y=100)
+        unit = FriendlyUnit(world_x=2000, world_y=2000)
+        unit.velocity_x = -50
+        unit.velocity_y = -50
+        carrier.collision_warnings.add(unit)
+        
+        assert not carrier.predict_collision(unit)
+        assert unit not in carrier.collision_warnings
+
+    def test_update_proximity_and_collision_batch(self):
+        """Test the batched proximity and collision check across several units."""
+        carrier = Carrier(world_x=100, world_y=100)
+        incoming = FriendlyUnit(world_x=250, world_y=100)
+        incoming.velocity_x = -60  # Reaches the carrier within the prediction window
+        nearby = FriendlyUnit(world_x=150, world_y=130)  # Close but stationary
+        distant = FriendlyUnit(world_x=2000, world_y=2000)
+        distant.velocity_x = -50
+        carrier.collision_warnings.add(distant)
+        
+        close_units = carrier.update_proximity_and_collision([carrier, incoming, nearby, distant])
+        
+        assert close_units == [nearby]
+        assert carrier.collision_warnings == {incoming}
+
+    def test_nearby_units_uses_grid_cells(self):
+        """Test that nearby_units returns units from the grid cells around the carrier."""
+        carrier = Carrier(world_x=100, world_y=100)
+        close = FriendlyUnit(world_x=150, world_y=120)
+        far = FriendlyUnit(world_x=3000, world_y=2500)
+        
+        Carrier.rebuild_unit_grid([carrier, close, far])
+        
+        assert carrier.nearby_units() == [close]
+        assert far in carrier.nearby_units(radius=4000)
+
+    def test_nearby_units_default_radius_covers_fast_incoming_units(self):
+        """Test that a fast unit outside the proximity radius still gets a warning through the grid."""
+        carrier = Carrier(world_x=100, world_y=100)
+        fast = FriendlyUnit(world_x=500, world_y=100)  # Well outside the proximity radius
+        fast.velocity_x = -200  # Reaches the carrier within the prediction window
+        bystander = FriendlyUnit(world_x=3000, world_y=3000)
+        
+        Carrier.rebuild_unit_grid([carrier, fast, bystander])
+        candidates = carrier.nearby_units()
+        close_units = carrier.update_proximity_and_collision(candidates)
+        
+        assert fast in candidates
+        assert bystander not in candidates
+        assert close_units == []
+        assert carrier.collision_warnings == {fast}
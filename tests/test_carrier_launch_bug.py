@@ -99,5 +99,24 @@ class TestCarrierLaunchBug(unittest.TestCase):
             # In the current implementation, this would fail:
             # self.assertIn(self.fighter1, self.friendly_units)
 
+    def test_key_command_only_receives_selected_carriers(self):
+        """Test that carrier key commands are given the selected carriers, not every carrier."""
+        other_carrier = Carrier(900, 900)
+        self.all_units.append(other_carrier)
+        self.carrier.selected = True
+        
+        launch_event = MagicMock()
+        launch_event.type = pygame.KEYDOWN
+        launch_event.key = self.input_handler.game_input.carrier_launch_key
+        
+        with patch.object(self.input_handler.game_input, 'process_carrier_key_command',
+                          return_value=None) as mock_process:
+            self.input_handler.process_input(
+                [launch_event], {}, (0, 0), 0.1, MagicMock(),
+                self.all_units, [self.carrier], MagicMock(), []
+            )
+        
+        self.assertEqual(mock_process.call_args[0][1], [self.carrier])
+
 if __name__ == '__main__':
     unittest.main()
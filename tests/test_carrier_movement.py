@@ -54,6 +54,16 @@ class TestCarrierMovement(unittest.TestCase):
         # Carrier should have moved closer to target
         self.assertLess(new_distance, initial_distance)
         
+    def test_carrier_direct_movement_flag(self):
+        """Test that the direct movement flag steps 5% of the way to the target."""
+        self.carrier.move_to_point(200, 200)
+        
+        with patch.object(Carrier, '_test_direct_movement', True):
+            self.carrier.update(0.05)
+        
+        self.assertAlmostEqual(self.carrier.world_x, 105)
+        self.assertAlmostEqual(self.carrier.world_y, 105)
+        
     def test_carrier_acceleration(self):
         """Test that the carrier accelerates properly."""
         # Set a target position far away
@@ -151,5 +151,38 @@ class TestCarrierMovementRestrictions(unittest.TestCase):
         self.assertEqual(self.carrier.max_rotation_speed, self.original_max_rotation_speed)
         self.assertEqual(self.carrier.restriction_reason, "")
 
+    def test_reason_updates_when_operation_changes(self):
+        """Test that switching from launching to landing updates the restriction reason."""
+        self.carrier.is_launching = True
+        self.carrier._update_movement_restrictions(0.05)
+        self.assertEqual(self.carrier.restriction_reason, "Active launch operations")
+        
+        # Same operation again leaves the restriction untouched
+        self.carrier._update_movement_restrictions(0.05)
+        self.assertEqual(self.carrier.max_speed, self.original_max_speed * 0.3)
+        
+        self.carrier.is_launching = False
+        self.carrier.is_landing_sequence_active = True
+        self.carrier._update_movement_restrictions(0.05)
+        self.assertEqual(self.carrier.restriction_reason, "Active landing operations")
+        self.assertEqual(self.carrier.max_speed, self.original_max_speed * 0.3)
+
+    def test_speed_change_while_restricted(self):
+        """Test that changing max_speed during a restriction is restricted and later restored."""
+        self.carrier.is_launching = True
+        self.carrier._update_movement_restrictions(0.05)
+        
+        # An upgrade raises the speed limit while the restriction is active
+        self.carrier.max_speed = 120
+        self.carrier._update_movement_restrictions(0.05)
+        self.assertAlmostEqual(self.carrier.max_speed, 120 * 0.3)
+        self.assertTrue(self.carrier.movement_restricted)
+        
+        # Ending the operation restores the new limit, not the one from before
+        self.carrier.is_launching = False
+        self.carrier._update_movement_restrictions(0.05)
+        self.assertEqual(self.carrier.max_speed, 120)
+        self.assertEqual(self.carrier.max_rotation_speed, self.original_max_rotation_speed)
+
 if __name__ == '__main__':
     unittest.main()
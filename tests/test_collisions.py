@@ -0,0 +1,46 @@
+"""Tests for the batched collision pass in collisions.py."""
+
+import math
+import sys
+import os
+
+import numpy as np
+
+# Add the parent directory to the path so we can import from the main package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from collisions import collision_pairs, resolve_unit_collisions
+from game_logic import detect_unit_collision
+from units import Unit
+
+
+def test_collision_pairs_match_pairwise_detection():
+    """Test that the batched pairs are exactly the pairs detect_unit_collision reports."""
+    units = [Unit((i * 53) % 400, (i * 29) % 300, 'friendly') for i in range(40)]
+    units[3].collision_enabled = False
+    units.append(Unit(units[5].world_x + 30, units[5].world_y, 'enemy'))  # Exactly touching
+
+    xs = np.array([u.world_x for u in units], dtype=float)
+    ys = np.array([u.world_y for u in units], dtype=float)
+    radii = np.array([u.radius for u in units], dtype=float)
+    enabled = np.array([getattr(u, 'collision_enabled', True) for u in units])
+    first, second = collision_pairs(xs, ys, radii, enabled)
+
+    expected = [(i, j) for i in range(len(units)) for j in range(i + 1, len(units))
+                if detect_unit_collision(units[i], units[j])]
+    assert list(zip(first.tolist(), second.tolist())) == expected
+    assert (5, len(units) - 1) in expected
+
+
+def test_resolve_unit_collisions_separates_overlapping_units():
+    """Test that overlapping units are pushed apart and disabled units are left alone."""
+    unit1 = Unit(100, 100, 'friendly')
+    unit2 = Unit(110, 100, 'friendly')
+    landing = Unit(105, 100, 'friendly')
+    landing.collision_enabled = False
+
+    resolve_unit_collisions([unit1, landing, unit2])
+
+    distance = math.hypot(unit2.world_x - unit1.world_x, unit2.world_y - unit1.world_y)
+    assert distance >= unit1.radius + unit2.radius - 1e-6
+    assert (landing.world_x, landing.world_y) == (105, 100)
@@ -52,5 +52,13 @@ def test_scaling_constants_exist_and_type():
     assert hasattr(constants, 'MINIMAP_SCALE_Y')
     assert isinstance(constants.MINIMAP_SCALE_Y, float)
 
+def test_minimap_params_bundle():
+    """Test that the bundled minimap layout matches the individual constants."""
+    assert constants.MINIMAP_PARAMS == (
+        constants.MINIMAP_SCALE_X, constants.MINIMAP_SCALE_Y,
+        constants.MINIMAP_X, constants.MINIMAP_Y,
+        constants.MINIMAP_WIDTH, constants.MINIMAP_HEIGHT,
+    )
+
 # It might be good to test the *values* if they are critical and unlikely to change
 # For now, just testing existence and type is sufficient for refactoring.
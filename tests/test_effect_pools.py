@@ -0,0 +1,265 @@
+"""Tests for the array-backed effect pools in effects.py."""
+
+import numpy as np
+import pytest
+import pygame
+import sys
+import os
+
+# Add the parent directory to the path so we can import from the main package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from camera import Camera
+from effects import AttackEffect, AttackEffectPool, DestinationIndicator, ExplosionEffect, ExplosionPool
+
+class TestAttackEffectPool:
+    def test_update_drops_expired_beams_and_keeps_order(self):
+        """Test that update ages every beam and compacts away the expired ones."""
+        pool = AttackEffectPool(capacity=2)  # Forces the pool to grow
+        for i in range(5):
+            pool.spawn((0, 0), (10 * i, 0), duration=0.1 * (i + 1))
+
+        pool.update(0.25)
+
+        assert len(pool) == 3
+        assert pool.end[:pool.n, 0].tolist() == [20, 30, 40]
+        assert pool.timer[:pool.n] == pytest.approx([0.05, 0.15, 0.25], abs=1e-6)
+
+    def test_pools_use_compact_dtypes(self):
+        """Test that pool arrays stay float32/uint8/int16, also after growing."""
+        attacks = AttackEffectPool(capacity=1)
+        explosions = ExplosionPool(capacity=1)
+        for _ in range(3):
+            attacks.spawn((0, 0), (10, 10))
+            explosions.spawn(0, 0)
+        explosions.update(0.01)
+
+        for arr in (attacks.timer, attacks.duration, attacks.start, attacks.end,
+                    explosions.timer, explosions.pos, explosions.max_radius):
+            assert arr.dtype == np.float32
+        for arr in (attacks.color, explosions.start_color, explosions.end_color, explosions.rgba):
+            assert arr.dtype == np.uint8
+        assert attacks.thickness.dtype == np.int16
+        assert explosions.radius.dtype == np.int16
+
+    def test_update_without_expiry_keeps_every_beam(self):
+        """Test that beams are only aged when none of them expire."""
+        pool = AttackEffectPool()
+        pool.spawn((0, 0), (10, 0), duration=0.5)
+        pool.spawn((0, 0), (20, 0), duration=0.3)
+
+        pool.update(0.1)
+
+        assert len(pool) == 2
+        assert pool.end[:2, 0].tolist() == [10, 20]
+        assert pool.timer[:2] == pytest.approx([0.4, 0.2])
+
+    def test_add_copies_attack_effect(self):
+        """Test that an AttackEffect from a unit update is copied into the pool."""
+        pool = AttackEffectPool()
+        effect = AttackEffect((1, 2), (3, 4), color=(255, 0, 0), duration=0.2, thickness=2)
+        effect.update(0.05)
+
+        pool.add(effect)
+
+        assert len(pool) == 1
+        assert pool.start[0].tolist() == [1, 2]
+        assert pool.color[0].tolist() == [255, 0, 0]
+        assert pool.timer[0] == pytest.approx(0.15)
+
+    def test_draw_all_renders_beam(self):
+        """Test that a live beam is drawn onto the surface."""
+        pool = AttackEffectPool()
+        pool.spawn((10, 50), (90, 50), color=(255, 0, 0))
+        surface = pygame.Surface((100, 100))
+
+        pool.draw_all(surface, Camera(100, 100))
+
+        assert surface.get_at((50, 50))[:3] != (0, 0, 0)
+
+    def test_beams_of_similar_length_share_a_cached_sprite(self):
+        """Test that beam sprites are cached and rotated to the beam direction."""
+        from effects import _beam_surface
+        _beam_surface.cache_clear()
+        pool = AttackEffectPool()
+        pool.spawn((10, 10), (90, 90), color=(255, 0, 0))
+        pool.spawn((10, 90), (90, 10), color=(255, 0, 0))
+        surface = pygame.Surface((100, 100))
+
+        pool.draw_all(surface, Camera(100, 100))
+
+        assert _beam_surface.cache_info().currsize == 1
+        assert surface.get_at((50, 50))[:3] != (0, 0, 0)  # Both diagonals cross here
+        assert surface.get_at((30, 30))[:3] != (0, 0, 0)
+        assert surface.get_at((50, 20))[:3] == (0, 0, 0)
+
+    def test_zero_duration_attack_effect_draws_nothing(self):
+        """Test that an AttackEffect without a duration stays invisible."""
+        effect = AttackEffect((10, 50), (90, 50), duration=0.0)
+        surface = pygame.Surface((100, 100))
+
+        effect.draw(surface, Camera(100, 100))
+
+        assert surface.get_at((50, 50))[:3] == (0, 0, 0)
+
+    def test_beams_add_light_to_the_background(self):
+        """Test that beams are blended additively onto what is already drawn."""
+        pool = AttackEffectPool()
+        pool.spawn((10, 50), (90, 50), color=(255, 0, 0))
+        surface = pygame.Surface((100, 100))
+        surface.fill((0, 0, 100))
+
+        pool.draw_all(surface, Camera(100, 100))
+
+        assert surface.get_at((50, 50))[:3] == (255, 255, 255)  # Core saturates
+        assert surface.get_at((50, 50 + 5))[2] >= 100  # Glow keeps the background blue
+
+    def test_faintest_beam_sprite_has_no_glow(self):
+        """Test that nearly faded beams are cached as a thin core without the glow."""
+        from effects import _beam_surface
+        faint = _beam_surface(32, 0, 3, (255, 0, 0))
+        bright = _beam_surface(32, 7, 3, (255, 0, 0))
+
+        assert faint.get_height() < bright.get_height()
+        # A white core, premultiplied by the step's alpha of 31
+        assert faint.get_at((16, faint.get_height() // 2)) == (31, 31, 31, 31)
+
+    def test_offscreen_beams_are_not_drawn(self):
+        """Test that beams outside the camera view are culled before drawing."""
+        from unittest.mock import patch
+        pool = AttackEffectPool()
+        pool.spawn((10, 50), (90, 50))
+        pool.spawn((500, 500), (600, 550))
+        effect = AttackEffect((-300, -300), (-200, -250))
+
+        with patch('effects._draw_beam') as mock_draw:
+            pool.draw_all(pygame.Surface((100, 100)), Camera(100, 100))
+            effect.draw(pygame.Surface((100, 100)), Camera(100, 100))
+
+        assert mock_draw.call_count == 1
+        assert mock_draw.call_args[0][1] == [10, 50]
+
+class TestExplosionPool:
+    def test_explosion_expires_after_duration(self):
+        """Test that explosions live for their duration and then disappear."""
+        pool = ExplosionPool()
+        pool.spawn(50, 50, max_radius=20, duration=0.5)
+
+        pool.update(0.3)
+        assert len(pool) == 1
+        pool.update(0.3)
+        assert len(pool) == 0
+
+    def test_draw_all_renders_expanding_circle(self):
+        """Test that a half-finished explosion is drawn around its center."""
+        pool = ExplosionPool()
+        pool.spawn(50, 50, max_radius=20, duration=1.0, start_color=(255, 0, 0), end_color=(255, 0, 0))
+        pool.update(0.5)
+        surface = pygame.Surface((100, 100))
+
+        pool.draw_all(surface, Camera(100, 100))
+
+        assert surface.get_at((50, 50))[0] > 0
+        assert surface.get_at((50, 75))[:3] == (0, 0, 0)  # Outside the 10px radius
+
+    def test_offscreen_explosions_are_not_drawn(self):
+        """Test that explosions outside the camera view are culled before drawing."""
+        from unittest.mock import patch
+        pool = ExplosionPool()
+        pool.spawn(50, 50, max_radius=20)
+        pool.spawn(400, 400, max_radius=20)
+        pool.update(0.1)
+
+        with patch('effects._blit_circle') as mock_blit:
+            pool.draw_all(pygame.Surface((100, 100)), Camera(100, 100))
+
+        assert mock_blit.call_count == 1
+        assert mock_blit.call_args[0][3:5] == (50, 50)
+
+    def test_update_matches_explosion_effect(self):
+        """Test that pooled radius and color follow the same curve as ExplosionEffect."""
+        pool = ExplosionPool(capacity=1)
+        pool.spawn(0, 0, max_radius=40, duration=0.8, start_color=(255, 165, 0), end_color=(100, 20, 20))
+        pool.spawn(0, 0, max_radius=10, duration=2.0)  # Forces the pool to grow
+        effect = ExplosionEffect(0, 0, max_radius=40, duration=0.8, start_color=(255, 165, 0), end_color=(100, 20, 20))
+
+        pool.update(0.3)
+        effect.update(0.3)
+
+        progress = (effect.duration - effect.timer) / effect.duration
+        assert pool.radius[0] == effect.current_radius
+        assert pool.rgba[0].tolist() == [
+            int(255 + (100 - 255) * progress),
+            int(165 + (20 - 165) * progress),
+            int(0 + (20 - 0) * progress),
+            int(255 * (1.0 - progress)),
+        ]
+
+class TestCircleCache:
+    def test_destination_indicator_reuses_cached_circle(self):
+        """Test that a fading indicator reuses one cached circle and fades via its alpha."""
+        from effects import DestinationIndicator, _circle_surface
+        _circle_surface.cache_clear()
+        indicator = DestinationIndicator(50, 50, color=(255, 0, 0), duration=1.0, radius=10)
+        camera = Camera(100, 100)
+
+        bright = pygame.Surface((100, 100))
+        indicator.draw(bright, camera)
+        indicator.update(0.75)
+        faded = pygame.Surface((100, 100))
+        indicator.draw(faded, camera)
+
+        info = _circle_surface.cache_info()
+        assert (info.misses, info.hits, info.currsize) == (1, 1, 1)
+        assert bright.get_at((50, 50))[0] > faded.get_at((50, 50))[0] > 0
+
+    def test_small_circles_are_scaled_from_template(self):
+        """Test that small circles are tinted copies of the antialiased template."""
+        from effects import _blit_circle, _circle_surface
+        _circle_surface.cache_clear()
+        surface = pygame.Surface((40, 40))
+
+        _blit_circle(surface, (0, 255, 0), 255, 20, 20, 4)
+
+        circle = _circle_surface(4, (0, 255, 0))
+        assert _circle_surface.cache_info().hits == 1
+        assert circle.get_size() == (8, 8)
+        assert circle.get_at((4, 4)) == (0, 255, 0, 255)
+        assert circle.get_at((0, 0)).a < 255  # Soft, antialiased edge
+        assert surface.get_at((20, 20))[:3] == (0, 255, 0)
+
+    def test_circle_cache_is_bounded(self):
+        """Test that sweeping through many explosion radius/color steps cannot grow the cache without limit."""
+        from effects import _blit_circle, _circle_surface
+        _circle_surface.cache_clear()
+        surface = pygame.Surface((40, 40))
+        maxsize = _circle_surface.cache_info().maxsize
+
+        for step in range(maxsize + 50):
+            _blit_circle(surface, (step % 256, step // 256, 0), 128, 20, 20, 2 + step % 10)
+
+        assert _circle_surface.cache_info().currsize == maxsize
+
+class TestDestinationIndicator:
+    def test_screen_position_recomputed_only_when_camera_moves(self):
+        """Test that an indicator reuses its screen position until the camera changes."""
+        from unittest.mock import patch
+        indicator = DestinationIndicator(50, 50, duration=1.0)
+        camera = Camera(100, 100, map_width=1000, map_height=1000)
+        surface = pygame.Surface((100, 100))
+
+        with patch.object(Camera, 'apply_coords', wraps=camera.apply_coords) as mock_apply:
+            indicator.draw(surface, camera)
+            indicator.draw(surface, camera)
+            assert mock_apply.call_count == 1
+
+            camera.world_x = 20.0
+            indicator.draw(surface, camera)
+            assert mock_apply.call_count == 2
+        assert indicator._screen == (30, 50)
+
+        # Moving the indicator off-screen skips drawing entirely
+        camera.world_x = 500.0
+        with patch('effects._blit_circle') as mock_blit:
+            indicator.draw(surface, camera)
+        mock_blit.assert_not_called()
@@ -80,3 +80,16 @@ class TestEffectUpdates:
         
         # Should return an empty list
         assert updated_effects == []
+
+    def test_update_effects_filters_real_effects_in_place(self):
+        """Test that real effects are updated once each and expired ones are dropped from the same list."""
+        short = [AttackEffect((0, 0), (10, 10), (255, 0, 0), duration=0.01) for _ in range(3)]
+        long = [ExplosionEffect(0, 0, 20, duration=1.0), DestinationIndicator(5, 5, duration=1.0),
+                AttackEffect((0, 0), (10, 10), (255, 0, 0), duration=1.0)]
+        effects = [short[0], long[0], short[1], long[1], short[2], long[2]]
+        
+        updated_effects = update_effects(effects, 0.016)
+        
+        assert updated_effects is effects
+        assert sorted(map(id, updated_effects)) == sorted(map(id, long))
+        assert all(effect.timer == pytest.approx(0.984) for effect in long)
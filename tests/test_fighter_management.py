@@ -83,6 +83,18 @@ class TestFighterStorage(unittest.TestCase):
         self.assertNotIn(extra_fighter, self.carrier.stored_fighters,
                          "Extra fighter should not be added to stored_fighters list")
 
+    def test_can_land_and_launch_properties(self):
+        """Test that the landing/launch checks are properties tracking hangar state."""
+        self.assertTrue(self.carrier.can_land_fighter)
+        self.assertFalse(self.carrier.can_launch_fighter,
+                         "An empty carrier has nothing to launch")
+
+        for i in range(self.carrier.fighter_capacity):
+            self.carrier.store_fighter(FriendlyUnit(i*100, i*100))
+
+        self.assertFalse(self.carrier.can_land_fighter)
+        self.assertTrue(self.carrier.can_launch_fighter)
+
 class TestLaunchPoints(unittest.TestCase):
     """Test case for the launch point functionality."""
     
@@ -175,6 +187,73 @@ class TestLaunchPoints(unittest.TestCase):
         
         # Should return None since there are no fighters to launch
         self.assertIsNone(launched_fighter, "Should return None when no fighters are available")
+    
+    def test_launch_spread_matches_offset_launches(self):
+        """Test that a spread launch fans fighters out like individual offset launches."""
+        self.carrier.rotation = 90
+        launched = self.carrier.launch_spread(3, 30)
+        
+        self.assertEqual(len(launched), 3)
+        self.assertEqual(len(self.carrier.stored_fighters), 2)
+        self.assertEqual([fighter.rotation for fighter in launched], [60, 90, 120])
+        
+        # The middle fighter lands where an unrotated offset launch would
+        expected = self.carrier.launch_fighter_with_offset(0)
+        self.assertAlmostEqual(launched[1].world_x, expected.world_x)
+        self.assertAlmostEqual(launched[1].world_y, expected.world_y)
+        self.assertAlmostEqual(launched[1].velocity_y, expected.velocity_y)
+    
+    def test_launch_spread_flags_carrier_as_launching(self):
+        """Test that a spread launch blocks queued launches like every other launch path."""
+        self.assertFalse(self.carrier.is_launching)
+        
+        self.carrier.launch_spread(2, 20)
+        
+        self.assertTrue(self.carrier.is_launching)
+        self.assertTrue(self.carrier.is_animating_launch)
+    
+    def test_launch_fighter_with_offset_uses_shared_flight_setup(self):
+        """Test that offset launches start the fighter's flight through the shared setup."""
+        with patch.object(Carrier, '_start_fighter_flight',
+                          autospec=True, side_effect=Carrier._start_fighter_flight) as mock_start:
+            fighter = self.carrier.launch_fighter_with_offset(45)
+        
+        mock_start.assert_called_once()
+        self.assertIs(mock_start.call_args.args[1], fighter)
+        self.assertEqual(fighter.rotation, self.carrier.rotation + 45)
+        self.assertTrue(self.carrier.is_launching)
+    
+    def test_launch_spread_limited_by_stored_fighters(self):
+        """Test that a spread launch never launches more fighters than are stored."""
+        launched = self.carrier.launch_spread(10, 45)
+        
+        self.assertEqual(len(launched), 5)
+        self.assertEqual(self.carrier.stored_fighters, [])
+
+    def test_launch_fighters_batch_matches_positioned_launches(self):
+        """Test that a batch launch places fighters like individual positioned launches."""
+        for i, fighter in enumerate(self.carrier.stored_fighters):
+            fighter.rotation = 30 * i
+        positions = [(700, 400), (720, 420)]
+        
+        launched = self.carrier.launch_fighters_batch(positions)
+        
+        self.assertEqual(len(launched), 2)
+        self.assertEqual(len(self.carrier.stored_fighters), 3)
+        self.assertEqual(self.carrier.current_launch_cooldown, self.carrier.launch_cooldown)
+        self.assertEqual([(f.world_x, f.world_y) for f in launched], positions)
+        
+        # A fighter launched on its own with the same heading gets the same momentum
+        single_carrier = Carrier(500, 300)
+        single_fighter = FriendlyUnit(0, 0)
+        single_fighter.rotation = launched[1].rotation
+        single_carrier.store_fighter(single_fighter)
+        single = single_carrier.launch_fighter(positions[1])
+        self.assertAlmostEqual(launched[1].velocity_x, single.velocity_x)
+        self.assertAlmostEqual(launched[1].velocity_y, single.velocity_y)
+        self.assertEqual(launched[1].move_target, single.move_target)
+        self.assertEqual(self.carrier.launch_fighters_batch(positions), [],
+                         "Batch launches respect the launch cooldown")
 
 class TestLaunchSequenceAndCooldown(unittest.TestCase):
     """Test case for the fighter launch sequence and cooldown functionality."""
@@ -486,6 +565,37 @@ class TestSequentialLaunchProcedure(unittest.TestCase):
         # Check that the sequence is now inactive (completed)
         self.assertFalse(self.carrier.is_launch_sequence_active, 
                         "Launch sequence should be inactive after queue is empty")
+    
+    def test_process_launch_queue_burst_with_time_budget(self):
+        """Test that a time budget allows several launches in one call."""
+        for _ in range(3):
+            self.carrier.queue_launch_request()
+        
+        # Enough spare time for two additional cooldown periods
+        dt = self.carrier.launch_cooldown * 2 + 0.1
+        fighters = self.carrier.process_launch_queue(self.game_units, dt)
+        
+        self.assertEqual(len(self.game_units), 3, 
+                       "All three queued fighters should launch in one call")
+        self.assertEqual(fighters, self.game_units, 
+                         "Every fighter launched in the call should be returned, in order")
+        self.assertEqual(len(self.carrier.launch_queue), 0, 
+                       "Launch queue should be drained")
+        self.assertGreater(self.carrier.current_launch_cooldown, 0, 
+                         "Cooldown should be running after the burst")
+        
+        # The carrier's own update counts this frame's time off the cooldown once
+        self.carrier.update(dt)
+        self.assertAlmostEqual(self.carrier.current_launch_cooldown,
+                               self.carrier.launch_cooldown * 3 - dt)
+    
+    def test_process_launch_queue_returns_empty_list_on_cooldown(self):
+        """Test that no launches in a call are reported as an empty list."""
+        self.carrier.queue_launch_request()
+        self.carrier.current_launch_cooldown = 1.0
+        
+        self.assertEqual(self.carrier.process_launch_queue(self.game_units), [])
+        self.assertEqual(self.game_units, [])
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,7 +3,7 @@
 import pytest
 import math
 
-from game_logic import update_unit_movement, find_closest_target, update_targeting
+from game_logic import update_unit_movement, find_closest_target, update_targeting, assign_closest_targets, update_targeting_batch
 from effects import AttackEffect  # Import for attack effect test
 
 # --- Mocks --- #
@@ -93,6 +93,19 @@ def test_find_closest_target():
     assert find_closest_target(unit, []) is None
 
 
+def test_find_closest_target_vectorized_matches_scan():
+    """Test that large target lists and shared position arrays give the same answer as a scan."""
+    from game_logic import unit_positions
+    unit = MockUnit(x=500, y=500, unit_id=0)
+    targets = [MockUnit(x=(i * 37) % 1000, y=(i * 91) % 1000, unit_id=i + 1) for i in range(60)]
+    targets.append(MockUnit(x=targets[10].world_x, y=targets[10].world_y, unit_id=99))  # Tie
+    
+    expected = min(targets, key=lambda t: math.hypot(t.world_x - unit.world_x, t.world_y - unit.world_y))
+    
+    assert find_closest_target(unit, targets) is expected
+    assert find_closest_target(unit, targets, positions=unit_positions(targets)) is expected
+
+
 def test_update_targeting():
     """Test that update_targeting sets the correct target based on unit type."""
     friendly_unit = MockUnit(x=0, y=0, unit_id=1)
@@ -117,6 +130,42 @@ def test_update_targeting():
     assert friendly_unit.last_target.id == enemy_unit.id
 
 
+def test_assign_closest_targets_matches_per_unit_scan():
+    """Test that batched targeting picks the same targets as find_closest_target and skips busy units."""
+    seekers = [MockUnit(x=(i * 113) % 900, y=(i * 47) % 700, unit_id=i) for i in range(30)]
+    targets = [MockUnit(x=(i * 71) % 1000, y=(i * 131) % 800, unit_id=100 + i) for i in range(25)]
+    for seeker in seekers:
+        seeker.chosen = None
+        seeker.set_target = lambda target, seeker=seeker: setattr(seeker, 'chosen', target)
+    seekers[0].state = 'attacking'
+    
+    assign_closest_targets(seekers, targets)
+    
+    assert seekers[0].chosen is None
+    for seeker in seekers[1:]:
+        assert seeker.chosen is find_closest_target(seeker, targets)
+
+
+def test_update_targeting_batch_targets_opposing_side():
+    """Test that the batched update gives idle units of each side a target from the other side."""
+    friendlies = [MockUnit(x=i * 40, y=0, unit_id=i) for i in range(20)]
+    enemies = [MockUnit(x=i * 40, y=300, unit_id=100 + i) for i in range(3)]
+    for unit in friendlies + enemies:
+        unit.chosen = None
+        unit.set_target = lambda target, unit=unit: setattr(unit, 'chosen', target)
+    for enemy in enemies:
+        enemy.type = 'enemy'
+    enemies[2].state = 'moving'
+    
+    update_targeting_batch(friendlies + enemies, friendlies, enemies)
+    
+    assert friendlies[1].chosen is enemies[1]
+    assert friendlies[19].chosen is enemies[2]
+    assert enemies[0].chosen is friendlies[0]
+    assert enemies[1].chosen is friendlies[1]
+    assert enemies[2].chosen is None
+
+
 def test_check_attack_range():
     """Test that check_attack_range correctly determines if units are in range."""
     # This function doesn't exist yet - it will be implemented in game_logic.py
@@ -8,6 +8,7 @@ import unittest
 import sys
 import os
 import pygame
+from collections import deque
 from unittest.mock import MagicMock, patch
 
 # Add parent directory to path to import game modules
@@ -165,7 +166,7 @@ class TestCarrierLaunchIntegration(unittest.TestCase):
         # For test purposes, manually adjust the launch queue if needed
         # This is necessary because the actual launch queue processing may have timing dependencies
         if len(self.carrier.launch_queue) != 1:
-            self.carrier.launch_queue = self.carrier.launch_queue[:1] if self.carrier.launch_queue else []
+            self.carrier.launch_queue = deque(list(self.carrier.launch_queue)[:1])
             
         self.assertEqual(len(self.carrier.launch_queue), len(self.carrier.launch_queue), 
                          "Launch queue should have the correct number of remaining requests")
@@ -167,6 +167,29 @@ class TestCarrierLandingSequence(unittest.TestCase):
         self.assertEqual(len(self.carrier.landing_queue), 0, 
                          "Landing queue should still be empty")
     
+    def test_dequeued_fighter_can_queue_again(self):
+        """Test that a fighter dropped from the landing queue may request landing again."""
+        fighter = self.fighters[0]
+        self.assertTrue(self.carrier.queue_landing_request(fighter))
+        self.assertFalse(self.carrier.queue_landing_request(fighter))
+        
+        # A fighter that is no longer in the game is dropped from the queue
+        self.carrier.process_landing_queue([self.carrier])
+        self.assertEqual(len(self.carrier.landing_queue), 0)
+        
+        self.assertTrue(self.carrier.queue_landing_request(fighter))
+    
+    def test_landing_timeout_counts_down_by_dt(self):
+        """Test that the landing timeout decreases by the elapsed time."""
+        fighter = self.fighters[0]
+        self.carrier.queue_landing_request(fighter)
+        
+        # The first call starts the timeout, later calls count it down
+        self.carrier.process_landing_queue(self.all_units, 0.5)
+        self.assertEqual(fighter.landing_timeout, 10.0)
+        self.carrier.process_landing_queue(self.all_units, 0.5)
+        self.assertAlmostEqual(fighter.landing_timeout, 9.5)
+    
     def test_process_landing_queue(self):
         """Test processing the landing queue."""
         # Create a completely separate test case class to avoid any shared state
@@ -125,6 +125,51 @@ class TestPlayerControlsForCarrier(unittest.TestCase):
         # Verify no fighter was launched
         self.assertIsNone(launched_fighter, "No fighter should be launched during cooldown")
         
+    def test_launch_all_key_queues_every_fighter(self):
+        """Test that the launch-all key (default 'A') queues all fighters without launching one directly."""
+        self.carrier.selected = True
+        
+        key_event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_a})
+        launched_fighter = self.game_input.process_carrier_key_command(key_event, [self.carrier])
+        
+        self.assertIsNone(launched_fighter, "Launch-all queues fighters instead of returning one")
+        self.assertEqual(len(self.carrier.launch_queue), 3, "All stored fighters should be queued")
+        
+    def test_process_input_ignores_mouse_motion(self):
+        """Test that irrelevant events return the shared empty result without touching carriers."""
+        self.carrier.selected = True
+        game_objects = {'carriers': [self.carrier]}
+        
+        motion = pygame.event.Event(pygame.MOUSEMOTION, {'pos': (10, 10), 'rel': (1, 1), 'buttons': (0, 0, 0)})
+        first = self.game_input.process_input(motion, game_objects)
+        second = self.game_input.process_input(motion, game_objects)
+        
+        self.assertIs(first, second)
+        self.assertIsNone(first['launched_fighter'])
+        self.assertFalse(first['command_processed'])
+        
+        key_event = pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_l})
+        results = self.game_input.process_input(key_event, game_objects)
+        self.assertIsNotNone(results['launched_fighter'])
+        self.assertTrue(results['command_processed'])
+        
+    def test_rebound_keys_take_effect(self):
+        """Test that changing the key attributes after construction changes the dispatch."""
+        self.carrier.selected = True
+        game_objects = {'carriers': [self.carrier]}
+        self.game_input.carrier_launch_key = pygame.K_a
+        self.game_input.carrier_launch_all_key = pygame.K_l
+        
+        results = self.game_input.process_input(
+            pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_a}), game_objects)
+        self.assertIsNotNone(results['launched_fighter'], "The rebound launch key launches one fighter")
+        self.assertFalse(results['launched_all'])
+        self.assertEqual(len(self.carrier.stored_fighters), 2)
+        
+        self.game_input.process_input(
+            pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_l}), game_objects)
+        self.assertEqual(len(self.carrier.launch_queue), 2, "The rebound launch-all key queues the rest")
+        
 class TestCarrierUIPanel(unittest.TestCase):
     """Tests for the CarrierPanel UI component that includes buttons for fighter management."""
     
@@ -292,6 +337,24 @@ class TestFighterReturnToCarrierCommands(unittest.TestCase):
         self.assertTrue(hasattr(self.fighter1, 'target_carrier'), "Fighter should have target_carrier attribute")
         self.assertEqual(self.fighter1.target_carrier, self.carrier, "Fighter's target_carrier should be set")
     
+    def test_return_command_sends_all_fighters_to_one_approach_point(self):
+        """Test that every returning fighter heads for the same point ahead of the carrier."""
+        from unittest.mock import patch
+        selected_units = [self.fighter1, self.carrier, self.fighter2]
+        
+        with patch.object(FriendlyUnit, 'move_to_point') as mock_move:
+            returned = self.game_input.process_return_to_carrier_command(
+                selected_units, self.carrier, (self.carrier.world_x, self.carrier.world_y)
+            )
+        
+        self.assertTrue(returned)
+        self.assertEqual(mock_move.call_count, 2, "The carrier itself is not sent to land")
+        first_call, second_call = mock_move.call_args_list
+        self.assertEqual(first_call, second_call)
+        approach_x, approach_y = first_call[0]
+        self.assertAlmostEqual(approach_x, self.carrier.world_x + self.carrier.radius * 1.5 * self.carrier.get_direction_x())
+        self.assertAlmostEqual(approach_y, self.carrier.world_y + self.carrier.radius * 1.5 * self.carrier.get_direction_y())
+    
     def test_no_return_when_carrier_at_capacity(self):
         """Test that fighter doesn't return to carrier when carrier is at capacity."""
         # Fill carrier to capacity
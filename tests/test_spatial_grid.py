@@ -0,0 +1,70 @@
+"""Tests for the uniform spatial grid in spatial_grid.py."""
+
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import from the main package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from spatial_grid import SpatialGrid
+from units import Unit
+
+class TestSpatialGrid:
+    def test_query_returns_units_in_surrounding_cells(self):
+        """Test that a query finds units in neighbouring cells but not distant ones."""
+        grid = SpatialGrid(cell_size=100)
+        near = Unit(120, 80, 'friendly')
+        neighbour_cell = Unit(210, 150, 'friendly')
+        distant = Unit(900, 900, 'enemy')
+        grid.rebuild([near, neighbour_cell, distant])
+
+        found = grid.query(150, 100, 60)
+
+        assert near in found
+        assert neighbour_cell in found
+        assert distant not in found
+
+    def test_rebuild_replaces_previous_positions(self):
+        """Test that rebuilding the grid forgets where units used to be."""
+        grid = SpatialGrid(cell_size=100)
+        unit = Unit(50, 50, 'friendly')
+        grid.rebuild([unit])
+
+        unit.world_x, unit.world_y = 850, 850
+        grid.rebuild([unit])
+
+        assert grid.query(50, 50, 10) == []
+        assert grid.query(850, 850, 10) == [unit]
+
+    def test_negative_coordinates(self):
+        """Test that units left of or above the origin land in their own cells."""
+        grid = SpatialGrid(cell_size=100)
+        unit = Unit(-30, -30, 'enemy')
+        grid.rebuild([unit])
+
+        assert grid.query(-50, -50, 10) == [unit]
+        assert grid.query(50, 50, 10) == []
+
+    def test_query_pairs_covers_every_overlapping_pair_once(self):
+        """Test that each overlapping pair is yielded exactly once, across cell borders too."""
+        units = [Unit((i * 37) % 500 - 120, (i * 61) % 400 - 90, 'friendly') for i in range(60)]
+        grid = SpatialGrid(cell_size=2 * max(unit.radius for unit in units))
+        grid.rebuild(units)
+
+        pairs = list(grid.query_pairs())
+
+        assert len(pairs) == len(set(pairs))
+        assert all(i < j for i, j in pairs)
+        for i in range(len(units)):
+            for j in range(i + 1, len(units)):
+                a, b = units[i], units[j]
+                if (a.world_x - b.world_x) ** 2 + (a.world_y - b.world_y) ** 2 <= (a.radius + b.radius) ** 2:
+                    assert (i, j) in pairs
+
+    def test_query_pairs_skips_distant_units(self):
+        """Test that units several cells apart are never paired."""
+        grid = SpatialGrid(cell_size=50)
+        grid.rebuild([Unit(0, 0, 'friendly'), Unit(10, 10, 'enemy'), Unit(400, 400, 'enemy')])
+
+        assert list(grid.query_pairs()) == [(0, 1)]
@@ -355,7 +355,7 @@ class CarrierPanel:
         button_rect = pygame.Rect(button_x, button_y, self.button_width, self.button_height)
         
         # Determine button state (enabled/disabled)
-        can_launch = self.selected_carrier.can_launch_fighter()
+        can_launch = self.selected_carrier.can_launch_fighter
         button_hover = button_rect.collidepoint(mouse_pos[0] - panel_x, mouse_pos[1] - panel_y)
         
         # Draw button with appropriate state
@@ -442,7 +442,7 @@ class CarrierPanel:
         # Check if click was on launch button
         if (self.launch_button_rect and 
             self.launch_button_rect.collidepoint(mouse_pos) and 
-            self.selected_carrier.can_launch_fighter()):
+            self.selected_carrier.can_launch_fighter):
             
             # Queue a launch request instead of directly launching
             success = self.selected_carrier.queue_launch_request()
@@ -3,6 +3,7 @@ import pygame
 import math
 import collections
 import random
+from enum import Enum
 from typing import Optional, Tuple, Union, List, TYPE_CHECKING
 from dataclasses import dataclass, field
 from effects import AttackEffect # Import the new effect class
@@ -25,7 +26,22 @@ BLUE = (0, 0, 255) # Example friendly attack color
 ORANGE = (255, 165, 0)
 YELLOW = (255, 255, 0)
 
-@dataclass
+class UnitState(str, Enum):
+    """Unit behaviour states.
+    
+    Members subclass str, so they compare, hash and print exactly like the
+    plain state strings used throughout the game (UnitState.MOVING == "moving").
+    """
+    IDLE = "idle"
+    MOVING = "moving"
+    ATTACKING = "attacking"
+    DESTROYED = "destroyed"
+    LANDING = "landing"
+    
+    def __str__(self) -> str:
+        return self.value
+
+@dataclass(eq=False)
 class Unit:
     """Represents a single game unit (friendly or enemy)."""
     # World position and basic properties
@@ -514,19 +530,19 @@ class Unit:
         return pygame.Rect(int(self.world_x) - self.radius, int(self.world_y) - self.radius,
                          self.radius * 2, self.radius * 2)
 
-    def set_state(self, new_state: str) -> None:
+    def set_state(self, new_state: Union[UnitState, str]) -> None:
         """Set the unit's state and handle transitions (like clearing trail)."""
         if self.state != new_state:
             self.state = new_state
             # Clear trail if not in a moving state
-            if self.state != "moving": 
+            if new_state != UnitState.MOVING:
                 self.trail_positions.clear()
                 
     def move_to(self, target_pos: Tuple[float, float]) -> None:
         """Set a movement target position."""
         self.move_target_pos = target_pos
         self.move_target = None # Clear attack target when moving to point
-        self.set_state("moving") # Use set_state
+        self.set_state(UnitState.MOVING) # Use set_state
         
     def set_target(self, target_unit: 'Unit') -> None:
         """Set a target unit to attack or follow.